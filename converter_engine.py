@@ -9,6 +9,10 @@ License: MIT
 import os
 import csv
 import time
+import queue
+import multiprocessing
+import logging.handlers
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
 from pathlib import Path
 from typing import List, Callable, Optional, Dict, Any
 from datetime import datetime
@@ -24,6 +28,34 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Set in each conversion worker process by _init_conversion_worker
+_worker_cancel_event = None
+_worker_progress_queue = None
+
+def _init_conversion_worker(log_queue, cancel_event, progress_queue):
+    """Send a worker process's log records, progress and cancellation through the parent's queues"""
+    global _worker_cancel_event, _worker_progress_queue
+    _worker_cancel_event = cancel_event
+    _worker_progress_queue = progress_queue
+    
+    root_logger = logging.getLogger()
+    root_logger.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+    root_logger.setLevel(logging.INFO)
+
+def _convert_file_in_worker(file_path: str, output_dir: str, formats: List[str]) -> Dict[str, Any]:
+    """Convert a single file with its own converter (runs in a worker process)"""
+    def report(message, percentage):
+        _worker_progress_queue.put((file_path, message, percentage))
+    
+    converter = MF4Converter(progress_callback=report, cancel_event=_worker_cancel_event)
+    return converter.batch_convert([file_path], output_dir, formats)
+
+class _RelayHandler(logging.Handler):
+    """Hand worker log records to the parent's loggers, and so to whatever handlers they have"""
+    
+    def emit(self, record):
+        logging.getLogger(record.name).handle(record)
+
 class ConversionError(Exception):
     """Custom exception for conversion errors"""
     pass
@@ -31,30 +63,34 @@ class ConversionError(Exception):
 class MF4Converter:
     """Enhanced converter class for MDF4 files with robust error handling"""
     
-    def __init__(self, progress_callback: Optional[Callable] = None):
+    def __init__(self, progress_callback: Optional[Callable] = None, cancel_event=None):
         """
         Initialize converter
         
         Args:
             progress_callback: Optional callback function for progress updates
+            cancel_event: Optional Event that cancels conversions when set (e.g. from another process)
         """
         self.progress_callback = progress_callback
+        self._cancel_event = cancel_event
         self.conversion_stats = {
             'files_processed': 0,
             'total_messages': 0,
             'errors': []
         }
+        self._cancel_requested = False
         
         logger.info(f"MF4Converter initialized - asammdf {'available' if ASAMMDF_AVAILABLE else 'not available'}")
         
-    def _update_progress(self, message: str, percentage: float = 0):
+    def _update_progress(self, message: str, percentage: float = 0, log: bool = True):
         """Update progress if callback is provided"""
         if self.progress_callback:
             try:
                 self.progress_callback(message, percentage)
             except Exception as e:
                 logger.warning(f"Progress callback failed: {e}")
-        logger.info(f"{percentage:3.0f}% - {message}")
+        if log:
+            logger.info(f"{percentage:3.0f}% - {message}")
     
     def validate_mdf4_file(self, file_path: str) -> bool:
         """
@@ -548,13 +584,15 @@ class MF4Converter:
             'total_messages': 0,
             'errors': []
         }
+        self._cancel_requested = False
+        start_time = datetime.now()
         
         results = {
             'successful': [],
             'failed': [],
             'total_files': len(file_list),
             'total_conversions': len(file_list) * len(formats),
-            'start_time': datetime.now(),
+            'start_time': start_time,
             'end_time': None,
             'summary': {}
         }
@@ -564,6 +602,10 @@ class MF4Converter:
         logger.info(f"Starting batch conversion: {len(file_list)} files × {len(formats)} formats = {results['total_conversions']} conversions")
         
         for file_idx, file_path in enumerate(file_list):
+            if self._is_cancelled():
+                logger.warning(f"Batch conversion cancelled after {file_idx}/{len(file_list)} files")
+                break
+            
             file_name = Path(file_path).stem
             self.conversion_stats['files_processed'] += 1
             
@@ -621,22 +663,17 @@ class MF4Converter:
                     conversion_info['error'] = error_message or "Unknown error"
                     results['failed'].append(conversion_info)
                     logger.warning(f"❌ {format_type.upper()}: {file_name} - {conversion_info['error']}")
+                
+                # Stop before the next format rather than finishing the whole file
+                if self._is_cancelled():
+                    break
         
-        # Finalize results
-        results['end_time'] = datetime.now()
-        results['duration'] = (results['end_time'] - results['start_time']).total_seconds()
-        
-        # Create summary
-        results['summary'] = {
-            'files_processed': self.conversion_stats['files_processed'],
-            'total_messages_processed': self.conversion_stats['total_messages'],
-            'successful_conversions': len(results['successful']),
-            'failed_conversions': len(results['failed']),
-            'success_rate': (len(results['successful']) / results['total_conversions']) * 100 if results['total_conversions'] > 0 else 0,
-            'formats_breakdown': self._create_format_breakdown(results),
-            'total_output_size': sum(conv['file_size'] for conv in results['successful']),
-            'errors': self.conversion_stats['errors']
-        }
+        results = self.merge_results(
+            [results], file_list, formats, start_time,
+            files_processed=self.conversion_stats['files_processed'],
+            total_messages=self.conversion_stats['total_messages'],
+            errors=self.conversion_stats['errors']
+        )
         
         # Log final summary
         logger.info(f"Batch conversion completed:")
@@ -648,7 +685,176 @@ class MF4Converter:
         
         return results
     
-    def _create_format_breakdown(self, results: Dict[str, Any]) -> Dict[str, Dict[str, int]]:
+    def convert_files_in_processes(self, file_list: List[str], output_dir: str, formats: List[str],
+                                   max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Convert files in a pool of worker processes, one file per task
+        
+        Args:
+            file_list: List of input MDF4 file paths
+            output_dir: Output directory
+            formats: List of formats to convert to ('csv', 'asc', 'trc')
+            max_workers: Worker process count (defaults to one per CPU, at most one per file)
+            
+        Returns:
+            Dictionary with detailed conversion results, shaped like batch_convert's
+        """
+        self._cancel_requested = False
+        start_time = datetime.now()
+        
+        # Nothing to convert: return the same empty result batch_convert does, without starting a pool
+        if not file_list:
+            return self.merge_results([], file_list, formats, start_time)
+        
+        workers = max(1, max_workers or min(len(file_list), os.cpu_count() or 1))
+        
+        # Spawned workers start clean instead of inheriting the GUI's threads and locks
+        ctx = multiprocessing.get_context("spawn")
+        caller_event = self._cancel_event
+        self._cancel_event = ctx.Event()
+        progress_queue = ctx.Queue()
+        
+        # Worker records come back over a per-batch process queue, so ordinary logging never pays for one
+        log_queue = ctx.Queue()
+        relay = logging.handlers.QueueListener(log_queue, _RelayHandler())
+        relay.start()
+        
+        self._update_progress(f"Converting {len(file_list)} files in {workers} worker process(es)...", 0)
+        
+        partials = []
+        file_progress = dict.fromkeys(file_list, 0.0)
+        done_count = 0
+        
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=ctx,
+                initializer=_init_conversion_worker,
+                initargs=(log_queue, self._cancel_event, progress_queue)
+            ) as executor:
+                futures = {
+                    executor.submit(_convert_file_in_worker, file_path, output_dir, formats): file_path
+                    for file_path in file_list
+                }
+                pending = set(futures)
+                
+                while pending:
+                    if self._cancel_requested:
+                        # Queued files are dropped; running workers stop after their current format
+                        self._cancel_event.set()
+                        for future in pending:
+                            future.cancel()
+                    
+                    done, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                    
+                    # Per-format progress from the workers, averaged over all files
+                    while True:
+                        try:
+                            file_path, message, percentage = progress_queue.get_nowait()
+                        except queue.Empty:
+                            break
+                        file_progress[file_path] = percentage
+                        overall = sum(file_progress.values()) / len(file_list)
+                        self._update_progress(f"{message} [{done_count}/{len(file_list)} files done]", overall, log=False)
+                    
+                    for future in done:
+                        file_path = futures[future]
+                        if future.cancelled():
+                            continue
+                        
+                        done_count += 1
+                        file_progress[file_path] = 100.0
+                        try:
+                            partials.append(future.result())
+                        except Exception as e:
+                            logger.error(f"Worker failed converting {file_path}: {e}")
+                            partials.append(self._worker_failure_result(file_path, output_dir, formats, e))
+                        
+                        self._update_progress(
+                            f"Converted {done_count}/{len(file_list)} files: {os.path.basename(file_path)}",
+                            sum(file_progress.values()) / len(file_list)
+                        )
+        finally:
+            self._cancel_event = caller_event
+            progress_queue.close()
+            relay.stop()
+        
+        results = self.merge_results(partials, file_list, formats, start_time)
+        logger.info(f"Parallel conversion completed: {len(results['successful'])}/{results['total_conversions']} successful in {results['duration']:.1f} seconds")
+        return results
+    
+    def _worker_failure_result(self, file_path: str, output_dir: str, formats: List[str], error: Exception) -> Dict[str, Any]:
+        """Record every format of a file as failed when its worker process died"""
+        failed = [{
+            'input_file': file_path,
+            'output_file': os.path.join(output_dir, f"{Path(file_path).stem}.{format_type}"),
+            'format': format_type,
+            'file_size': 0,
+            'timestamp': datetime.now(),
+            'error': f"Worker process failed: {str(error)}"
+        } for format_type in formats]
+        return {'successful': [], 'failed': failed, 'summary': {'files_processed': 1}}
+    
+    def merge_results(self, partials: List[Dict[str, Any]], file_list: List[str], formats: List[str],
+                      start_time: datetime, files_processed: Optional[int] = None,
+                      total_messages: Optional[int] = None, errors: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Combine batch_convert results (e.g. one per worker process) into a single result
+        
+        Args:
+            partials: Result dictionaries to combine
+            file_list: All input files of the batch
+            formats: Formats requested for the batch
+            start_time: When the batch started
+            files_processed, total_messages, errors: Totals to use instead of summing the partials' summaries
+            
+        Returns:
+            Dictionary with detailed conversion results, including the summary
+        """
+        successful = [conv for partial in partials for conv in partial['successful']]
+        failed = [conv for partial in partials for conv in partial['failed']]
+        summaries = [partial.get('summary', {}) for partial in partials]
+        
+        if files_processed is None:
+            files_processed = sum(summary.get('files_processed', 0) for summary in summaries)
+        if total_messages is None:
+            total_messages = sum(summary.get('total_messages_processed', 0) for summary in summaries)
+        if errors is None:
+            errors = [error for summary in summaries for error in summary.get('errors', [])]
+        
+        total_conversions = len(file_list) * len(formats)
+        results = {
+            'successful': successful,
+            'failed': failed,
+            'total_files': len(file_list),
+            'total_conversions': total_conversions,
+            'start_time': start_time,
+            'end_time': datetime.now()
+        }
+        results['duration'] = (results['end_time'] - start_time).total_seconds()
+        results['summary'] = {
+            'files_processed': files_processed,
+            'total_messages_processed': total_messages,
+            'successful_conversions': len(successful),
+            'failed_conversions': len(failed),
+            'success_rate': (len(successful) / total_conversions) * 100 if total_conversions > 0 else 0,
+            'formats_breakdown': self.create_format_breakdown(results),
+            'total_output_size': sum(conv['file_size'] for conv in successful),
+            'errors': errors
+        }
+        return results
+    
+    def cancel_conversion(self):
+        """Ask a running conversion to stop after the format it is converting"""
+        self._cancel_requested = True
+        if self._cancel_event is not None:
+            self._cancel_event.set()
+    
+    def _is_cancelled(self) -> bool:
+        """Check for a cancel request from this process or, in a worker, from the parent"""
+        return self._cancel_requested or (self._cancel_event is not None and self._cancel_event.is_set())
+    
+    def create_format_breakdown(self, results: Dict[str, Any]) -> Dict[str, Dict[str, int]]:
         """Create a breakdown of conversion results by format"""
         breakdown = {}
         
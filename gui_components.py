@@ -10,36 +10,70 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import threading
 import os
+import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional
 import logging
 
-# Try to import CustomTkinter for enhanced UI
-try:
-    import customtkinter as ctk
-    CTK_AVAILABLE = True
-except ImportError:
-    CTK_AVAILABLE = False
+# CustomTkinter is bound lazily by _try_import_ctk() when a GUI is created
+ctk = None
+_CTK_THEME_PINNED = False
 
-from converter_engine import MF4Converter
 from utils import (
-    validate_file_extension, 
     create_output_directory, 
     format_file_size,
     validate_output_directory,
-    get_system_info
+    get_system_info,
+    cleanup_temp_files,
+    load_settings,
+    save_settings
 )
 
 logger = logging.getLogger(__name__)
 
+# Button labels shared by widget creation and state changes
+BTN_SELECT = "📁 Select MDF4 Files"
+BTN_CLEAR = "🗑️ Clear All"
+BTN_BROWSE = "Browse"
+BTN_CONVERT = "🚀 Convert Files"
+BTN_CONVERTING = "Converting..."
+BTN_ABOUT = "ℹ️ About"
+BTN_EXIT = "❌ Exit"
+
+def _try_import_ctk():
+    """Import CustomTkinter on first use, returning None if it is unavailable"""
+    global ctk
+    if ctk is None:
+        try:
+            import customtkinter
+            ctk = customtkinter
+        except ImportError:
+            return None
+    return ctk
+
+def pin_ctk_theme():
+    """Set the CustomTkinter appearance mode and color theme once, before any widgets exist"""
+    global _CTK_THEME_PINNED
+    if _CTK_THEME_PINNED or _try_import_ctk() is None:
+        return
+    ctk.set_appearance_mode("system")
+    ctk.set_default_color_theme("blue")
+    _CTK_THEME_PINNED = True
+
 class ResponsiveFrame:
     """Helper class for responsive layout management"""
     
     @staticmethod
-    def get_screen_info():
-        """Get screen dimensions and scaling info"""
-        root = tk.Tk()
-        root.withdraw()  # Hide the window
+    def get_screen_info(root=None):
+        """Get screen dimensions and scaling info, using an existing root if given"""
+        # A temporary Tk instance costs a second interpreter and window; only create one if needed
+        owns_root = root is None
+        if owns_root:
+            root = tk.Tk()
+            root.withdraw()  # Hide the window
         
         screen_width = root.winfo_screenwidth()
         screen_height = root.winfo_screenheight()
@@ -51,7 +85,8 @@ class ResponsiveFrame:
         except:
             scaling = 1.0
         
-        root.destroy()
+        if owns_root:
+            root.destroy()
         
         return {
             'width': screen_width,
@@ -84,13 +119,35 @@ class ResponsiveFrame:
 class MF4BridgeGUI:
     """Enhanced GUI class with responsive design and improved UX"""
     
+    # Initial output/input size ratios used for disk space estimates
+    DEFAULT_FORMAT_MULTIPLIERS = {'csv': 3.0, 'asc': 1.2, 'trc': 1.2}
+    
+    # Accepted input extensions, compared case-insensitively
+    _VALID_EXTS = (".mf4", ".mdf")
+    
+    # Minimum seconds between progress repaints
+    PROGRESS_INTERVAL = 0.033
+    
+    # Row count above which the file list is hidden while rows are inserted
+    BULK_INSERT_THRESHOLD = 50
+    
+    # Most MDF4 header checks kept for re-added files
+    VALIDATION_CACHE_SIZE = 2048
+    
     def __init__(self, root):
         """Initialize the responsive GUI"""
         self.root = root
-        self.using_ctk = CTK_AVAILABLE and isinstance(root, (ctk.CTk if CTK_AVAILABLE else type(None)))
+        # A CTk root means customtkinter is already loaded; never import it just to check
+        ctk_module = _try_import_ctk() if 'customtkinter' in sys.modules else None
+        self.using_ctk = ctk_module is not None and isinstance(root, ctk_module.CTk)
+        if self.using_ctk:
+            pin_ctk_theme()
+        
+        # Resolve widget classes for the active toolkit once
+        self._widget_classes = self.resolve_widget_classes()
         
         # Get screen information for responsive design
-        self.screen_info = ResponsiveFrame.get_screen_info()
+        self.screen_info = ResponsiveFrame.get_screen_info(self.root)
         logger.info(f"Screen info: {self.screen_info}")
         
         # Initialize variables first
@@ -102,9 +159,21 @@ class MF4BridgeGUI:
         # Create responsive widgets
         self.setup_responsive_widgets()
         
-        # Initialize converter
+        # Initialize converter (imported here so asammdf loads only once a window exists)
+        from converter_engine import MF4Converter, ASAMMDF_AVAILABLE
+        self.asammdf_available = ASAMMDF_AVAILABLE
         self.converter = MF4Converter(progress_callback=self.update_progress)
         
+        # Header parsing can block for seconds on network drives, so it runs off the Tk thread
+        self._validation_pool = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1))
+        
+        # One long-lived worker runs conversions so repeat runs reuse the warm thread
+        self._conv_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mf4-conv")
+        self._validation_generation = 0
+        
+        # Validation batches still being polled; conversion waits until this is zero
+        self._pending_validation_batches = 0
+        
         # Setup auto-cleanup
         self.setup_cleanup()
         
@@ -120,13 +189,40 @@ class MF4BridgeGUI:
         self.asc_var = tk.BooleanVar(value=False)
         self.trc_var = tk.BooleanVar(value=False)
         
+        # Last folders used in the file dialogs
+        self._last_input_dir = os.path.expanduser("~")
+        self._last_output_dir = os.path.expanduser("~")
+        
         # Progress variables
         self.progress_var = tk.DoubleVar()
         self.status_var = tk.StringVar(value="Ready - Select MDF4 files to begin")
         
         # Conversion state
         self.is_converting = False
-        self.conversion_thread = None
+        self.conversion_future = None
+        
+        # Buttons disabled while a conversion is running, appended as they are created
+        self._toggleable_btns = []
+        
+        # Latest progress from the worker thread, flushed to the UI at most every 33 ms
+        self._progress_lock = threading.Lock()
+        self._pending_progress = None
+        self._progress_scheduled = False
+        self._last_progress_ts = 0.0
+        self._last_progress = (None, -1.0)
+        
+        # Per-file display rows and sizes, filled once when a file is added
+        self._file_meta = {}
+        self._selected_set = set()
+        self._rendered_count = 0
+        self._file_sizes = {}
+        self._total_input_bytes = 0
+        
+        # MDF4 header checks keyed by path, kept across clears; reused while (mtime, size) match.
+        # Least recently used entries are evicted past VALIDATION_CACHE_SIZE
+        self._validation_cache = OrderedDict()
+        self._validation_cache_lock = threading.Lock()
+        self._format_multipliers = self._load_format_multipliers()
         
     def setup_responsive_window(self):
         """Configure window with responsive sizing"""
@@ -157,6 +253,30 @@ class MF4BridgeGUI:
         # Handle window close event
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
         
+    def resolve_widget_classes(self) -> dict:
+        """Map generic widget names to CustomTkinter or ttk classes"""
+        if self.using_ctk:
+            return {
+                'Frame': ctk.CTkFrame,
+                'Label': ctk.CTkLabel,
+                'Button': ctk.CTkButton,
+                'CheckBox': ctk.CTkCheckBox,
+                'Entry': ctk.CTkEntry,
+                'ProgressBar': ctk.CTkProgressBar
+            }
+        return {
+            'Frame': ttk.Frame,
+            'Label': ttk.Label,
+            'Button': ttk.Button,
+            'CheckBox': ttk.Checkbutton,
+            'Entry': ttk.Entry,
+            'ProgressBar': ttk.Progressbar
+        }
+    
+    def create_widget(self, widget_type: str, parent, **kwargs):
+        """Create a widget of the given generic type for the active toolkit"""
+        return self._widget_classes[widget_type](parent, **kwargs)
+    
     def set_window_icon(self):
         """Set window icon if available"""
         try:
@@ -189,6 +309,9 @@ class MF4BridgeGUI:
         padding = self.get_responsive_padding()
         fonts = self.get_font_sizes()
         
+        self._fonts = self.build_fonts(fonts)
+        self._styles = self.build_styles(fonts, padding)
+        
         # Create main scrollable container
         self.create_scrollable_container(padding)
         
@@ -224,11 +347,9 @@ class MF4BridgeGUI:
             self.v_scrollbar = ttk.Scrollbar(self.main_frame, orient="vertical", command=self.canvas.yview)
             self.scroll_frame = ttk.Frame(self.canvas)
             
-            # Configure scrolling
-            self.scroll_frame.bind(
-                "<Configure>",
-                lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-            )
+            # Configure scrolling; resizes during layout are coalesced per idle cycle
+            self._scrollregion_pending = False
+            self.scroll_frame.bind("<Configure>", lambda e: self._schedule_scrollregion())
             
             self.canvas_frame = self.canvas.create_window((0, 0), window=self.scroll_frame, anchor="nw")
             self.canvas.configure(yscrollcommand=self.v_scrollbar.set)
@@ -265,7 +386,7 @@ class MF4BridgeGUI:
             
             # Handle canvas resize
             def _configure_scroll_region(event):
-                self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+                self._schedule_scrollregion()
                 
                 # Update canvas window width
                 canvas_width = event.width
@@ -273,119 +394,136 @@ class MF4BridgeGUI:
             
             self.canvas.bind('<Configure>', _configure_scroll_region)
     
+    def build_styles(self, fonts, padding) -> dict:
+        """Collect toolkit-specific widget options used by the create_* methods"""
+        action_button = {'height': 40, 'width': 200} if self.screen_info['is_small'] else {'height': 50}
+        
+        if self.using_ctk:
+            return {
+                'header_frame': {},
+                'file_button': {'height': 30 if self.screen_info['is_small'] else 35},
+                'action_button': action_button,
+                'primary_button': dict(action_button, font=self._fonts['button']),
+                'browse_button': {'width': 80},
+                'dir_entry': {'placeholder_text': "Select output directory..."},
+                'progress_bar': {}
+            }
+        
+        # ttk buttons take no font/size options; their look comes from the theme
+        return {
+            'header_frame': {'padding': str(padding['inner']), 'relief': "groove", 'borderwidth': 2},
+            'file_button': {},
+            'action_button': {},
+            'primary_button': {},
+            'browse_button': {},
+            'dir_entry': {},
+            'progress_bar': {'variable': self.progress_var, 'maximum': 100, 'mode': 'determinate'}
+        }
+    
+    def build_fonts(self, fonts) -> dict:
+        """Create each font once so widgets share the same font objects"""
+        return {
+            'title': self._font(fonts['title'], "bold"),
+            'subtitle': self._font(fonts['subtitle']),
+            'section': self._font(fonts['section'], "bold"),
+            'body': self._font(fonts['normal']),
+            'bold': self._font(weight="bold"),
+            'button': self._font(fonts['normal'] + 2, "bold")
+        }
+    
+    def _font(self, size: Optional[int] = None, weight: str = "normal"):
+        """Create a font for the active toolkit"""
+        if self.using_ctk:
+            return ctk.CTkFont(size=size, weight=weight)
+        return ("Arial", size or self.get_font_sizes()['normal'], weight)
+    
+    def _schedule_scrollregion(self):
+        """Recompute the canvas scroll region at most once per idle cycle"""
+        if self._scrollregion_pending:
+            return
+        self._scrollregion_pending = True
+        self.root.after_idle(self._update_scrollregion)
+    
+    def _update_scrollregion(self):
+        """Fit the canvas scroll region to its contents"""
+        self._scrollregion_pending = False
+        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+    
+    def create_titled_frame(self, parent, title: str, font, padding):
+        """Create a frame with a heading (LabelFrame for ttk, label in row 0 for CTk)"""
+        if not self.using_ctk:
+            return ttk.LabelFrame(parent, text=title, padding=str(padding['inner']))
+        
+        frame = self.create_widget("Frame", parent)
+        heading = self.create_widget("Label", frame, text=title, font=font)
+        heading.grid(row=0, column=0, columnspan=3, pady=(padding['inner'], padding['inner']//2))
+        return frame
+    
     def create_responsive_header(self, fonts, padding):
         """Create responsive header section"""
-        if self.using_ctk:
-            header_frame = ctk.CTkFrame(self.container)
-            header_frame.grid(row=0, column=0, sticky="ew", pady=(0, padding['section']))
-            header_frame.grid_columnconfigure(0, weight=1)
-            
-            title_label = ctk.CTkLabel(
-                header_frame,
-                text="MF4Bridge",
-                font=ctk.CTkFont(size=fonts['title'], weight="bold")
-            )
-            title_label.grid(row=0, column=0, pady=(padding['inner'], 5))
-            
-            subtitle_label = ctk.CTkLabel(
-                header_frame,
-                text="Convert MDF4 files to ASC, CSV, and TRC formats",
-                font=ctk.CTkFont(size=fonts['subtitle'])
-            )
-            subtitle_label.grid(row=1, column=0, pady=(0, padding['inner']))
-        else:
-            header_frame = ttk.LabelFrame(self.container, padding=str(padding['inner']))
-            header_frame.grid(row=0, column=0, sticky="ew", pady=(0, padding['section']))
-            header_frame.grid_columnconfigure(0, weight=1)
-            
-            title_label = ttk.Label(
-                header_frame,
-                text="MF4Bridge",
-                font=("Arial", fonts['title'], "bold")
-            )
-            title_label.grid(row=0, column=0, pady=(0, 5))
-            
-            subtitle_label = ttk.Label(
-                header_frame,
-                text="Convert MDF4 files to ASC, CSV, and TRC formats",
-                font=("Arial", fonts['subtitle'])
-            )
-            subtitle_label.grid(row=1, column=0)
+        header_frame = self.create_widget("Frame", self.container, **self._styles['header_frame'])
+        header_frame.grid(row=0, column=0, sticky="ew", pady=(0, padding['section']))
+        header_frame.grid_columnconfigure(0, weight=1)
+        
+        title_label = self.create_widget(
+            "Label",
+            header_frame,
+            text="MF4Bridge",
+            font=self._fonts['title']
+        )
+        title_label.grid(row=0, column=0, pady=(padding['inner']//2, 5))
+        
+        subtitle_label = self.create_widget(
+            "Label",
+            header_frame,
+            text="Convert MDF4 files to ASC, CSV, and TRC formats",
+            font=self._fonts['subtitle']
+        )
+        subtitle_label.grid(row=1, column=0, pady=(0, padding['inner']//2))
     
     def create_responsive_input_section(self, fonts, padding):
         """Create responsive file input section"""
         row_num = 1
         
-        if self.using_ctk:
-            input_frame = ctk.CTkFrame(self.container)
-            input_frame.grid(row=row_num, column=0, sticky="ew", pady=(0, padding['section']))
-            input_frame.grid_columnconfigure(0, weight=1)
-            
-            section_label = ctk.CTkLabel(
-                input_frame,
-                text="Input Files",
-                font=ctk.CTkFont(size=fonts['section'], weight="bold")
-            )
-            section_label.grid(row=0, column=0, pady=(padding['inner'], padding['inner']//2))
-        else:
-            input_frame = ttk.LabelFrame(self.container, text="Input Files", padding=str(padding['inner']))
-            input_frame.grid(row=row_num, column=0, sticky="ew", pady=(0, padding['section']))
-            input_frame.grid_columnconfigure(0, weight=1)
+        input_frame = self.create_titled_frame(
+            self.container, "Input Files", self._fonts['section'], padding
+        )
+        input_frame.grid(row=row_num, column=0, sticky="ew", pady=(0, padding['section']))
+        input_frame.grid_columnconfigure(0, weight=1)
         
         # Button frame with responsive layout
-        button_frame = ctk.CTkFrame(input_frame) if self.using_ctk else ttk.Frame(input_frame)
+        button_frame = self.create_widget("Frame", input_frame)
         button_frame.grid(row=1, column=0, sticky="ew", pady=(0, padding['inner']))
         button_frame.grid_columnconfigure(2, weight=1)  # Make middle column expand
         
-        # Responsive button sizing
-        button_height = 35 if not self.screen_info['is_small'] else 30
-        
-        if self.using_ctk:
-            self.select_files_btn = ctk.CTkButton(
-                button_frame,
-                text="📁 Select MDF4 Files",
-                command=self.select_files,
-                height=button_height
-            )
-            self.select_files_btn.grid(row=0, column=0, padx=(0, padding['inner']//2), pady=5, sticky="w")
-            
-            self.clear_files_btn = ctk.CTkButton(
-                button_frame,
-                text="🗑️ Clear All",
-                command=self.clear_files,
-                height=button_height
-            )
-            self.clear_files_btn.grid(row=0, column=1, pady=5, sticky="w")
-            
-            # File count label
-            self.file_count_label = ctk.CTkLabel(
-                button_frame,
-                text="No files selected",
-                font=ctk.CTkFont(size=fonts['normal'])
-            )
-            self.file_count_label.grid(row=0, column=3, padx=(padding['inner'], 0), pady=5, sticky="e")
-        else:
-            self.select_files_btn = ttk.Button(
-                button_frame,
-                text="📁 Select MDF4 Files",
-                command=self.select_files
-            )
-            self.select_files_btn.grid(row=0, column=0, padx=(0, padding['inner']//2), sticky="w")
-            
-            self.clear_files_btn = ttk.Button(
-                button_frame,
-                text="🗑️ Clear All",
-                command=self.clear_files
-            )
-            self.clear_files_btn.grid(row=0, column=1, sticky="w")
-            
-            # File count label
-            self.file_count_label = ttk.Label(
-                button_frame,
-                text="No files selected",
-                font=("Arial", fonts['normal'])
-            )
-            self.file_count_label.grid(row=0, column=3, padx=(padding['inner'], 0), sticky="e")
+        self.select_files_btn = self.create_widget(
+            "Button",
+            button_frame,
+            text=BTN_SELECT,
+            command=self.select_files,
+            **self._styles['file_button']
+        )
+        self.select_files_btn.grid(row=0, column=0, padx=(0, padding['inner']//2), pady=5, sticky="w")
+        self._toggleable_btns.append(self.select_files_btn)
+        
+        self.clear_files_btn = self.create_widget(
+            "Button",
+            button_frame,
+            text=BTN_CLEAR,
+            command=self.clear_files,
+            **self._styles['file_button']
+        )
+        self.clear_files_btn.grid(row=0, column=1, pady=5, sticky="w")
+        self._toggleable_btns.append(self.clear_files_btn)
+        
+        # File count label
+        self.file_count_label = self.create_widget(
+            "Label",
+            button_frame,
+            text="No files selected",
+            font=self._fonts['body']
+        )
+        self.file_count_label.grid(row=0, column=3, padx=(padding['inner'], 0), pady=5, sticky="e")
         
         # File list with responsive height
         list_height = 4 if self.screen_info['is_small'] else 6
@@ -393,7 +531,7 @@ class MF4BridgeGUI:
     
     def create_file_list(self, parent, height, fonts, padding):
         """Create responsive file list widget"""
-        list_frame = ctk.CTkFrame(parent) if self.using_ctk else ttk.Frame(parent)
+        list_frame = self.create_widget("Frame", parent)
         list_frame.grid(row=2, column=0, sticky="ew", pady=(0, padding['inner']))
         list_frame.grid_columnconfigure(0, weight=1)
         
@@ -425,21 +563,11 @@ class MF4BridgeGUI:
         """Create responsive output configuration section"""
         row_num = 2
         
-        if self.using_ctk:
-            output_frame = ctk.CTkFrame(self.container)
-            output_frame.grid(row=row_num, column=0, sticky="ew", pady=(0, padding['section']))
-            output_frame.grid_columnconfigure(0, weight=1)
-            
-            section_label = ctk.CTkLabel(
-                output_frame,
-                text="Output Configuration",
-                font=ctk.CTkFont(size=fonts['section'], weight="bold")
-            )
-            section_label.grid(row=0, column=0, pady=(padding['inner'], padding['inner']//2))
-        else:
-            output_frame = ttk.LabelFrame(self.container, text="Output Configuration", padding=str(padding['inner']))
-            output_frame.grid(row=row_num, column=0, sticky="ew", pady=(0, padding['section']))
-            output_frame.grid_columnconfigure(0, weight=1)
+        output_frame = self.create_titled_frame(
+            self.container, "Output Configuration", self._fonts['section'], padding
+        )
+        output_frame.grid(row=row_num, column=0, sticky="ew", pady=(0, padding['section']))
+        output_frame.grid_columnconfigure(0, weight=1)
         
         # Format selection with responsive layout
         if self.screen_info['is_small']:
@@ -454,334 +582,163 @@ class MF4BridgeGUI:
     
     def create_format_selection_vertical(self, parent, fonts, padding):
         """Create vertical format selection for small screens"""
-        format_frame = ctk.CTkFrame(parent) if self.using_ctk else ttk.LabelFrame(parent, text="Output Formats")
+        format_frame = self.create_titled_frame(parent, "Output Formats", self._fonts['bold'], padding)
         format_frame.grid(row=1, column=0, sticky="ew", pady=(0, padding['inner']))
         format_frame.grid_columnconfigure(0, weight=1)
         
-        if self.using_ctk:
-            format_label = ctk.CTkLabel(
-                format_frame,
-                text="Output Formats:",
-                font=ctk.CTkFont(weight="bold")
-            )
-            format_label.grid(row=0, column=0, pady=(padding['inner'], 5), sticky="w")
-            
-            self.csv_checkbox = ctk.CTkCheckBox(
-                format_frame,
-                text="CSV (Comma Separated Values)",
-                variable=self.csv_var
-            )
-            self.csv_checkbox.grid(row=1, column=0, pady=2, padx=padding['inner'], sticky="w")
-            
-            self.asc_checkbox = ctk.CTkCheckBox(
-                format_frame,
-                text="ASC (Vector CANoe/CANalyzer)",
-                variable=self.asc_var
-            )
-            self.asc_checkbox.grid(row=2, column=0, pady=2, padx=padding['inner'], sticky="w")
-            
-            self.trc_checkbox = ctk.CTkCheckBox(
-                format_frame,
-                text="TRC (PEAK PCAN-View)",
-                variable=self.trc_var
-            )
-            self.trc_checkbox.grid(row=3, column=0, pady=(2, padding['inner']), padx=padding['inner'], sticky="w")
-        else:
-            self.csv_checkbox = ttk.Checkbutton(
-                format_frame,
-                text="CSV (Comma Separated Values)",
-                variable=self.csv_var
-            )
-            self.csv_checkbox.grid(row=0, column=0, sticky="w", pady=2)
-            
-            self.asc_checkbox = ttk.Checkbutton(
-                format_frame,
-                text="ASC (Vector CANoe/CANalyzer)",
-                variable=self.asc_var
-            )
-            self.asc_checkbox.grid(row=1, column=0, sticky="w", pady=2)
-            
-            self.trc_checkbox = ttk.Checkbutton(
-                format_frame,
-                text="TRC (PEAK PCAN-View)",
-                variable=self.trc_var
-            )
-            self.trc_checkbox.grid(row=2, column=0, sticky="w", pady=2)
+        self.csv_checkbox = self.create_widget(
+            "CheckBox",
+            format_frame,
+            text="CSV (Comma Separated Values)",
+            variable=self.csv_var
+        )
+        self.csv_checkbox.grid(row=1, column=0, pady=2, padx=padding['inner'], sticky="w")
+        
+        self.asc_checkbox = self.create_widget(
+            "CheckBox",
+            format_frame,
+            text="ASC (Vector CANoe/CANalyzer)",
+            variable=self.asc_var
+        )
+        self.asc_checkbox.grid(row=2, column=0, pady=2, padx=padding['inner'], sticky="w")
+        
+        self.trc_checkbox = self.create_widget(
+            "CheckBox",
+            format_frame,
+            text="TRC (PEAK PCAN-View)",
+            variable=self.trc_var
+        )
+        self.trc_checkbox.grid(row=3, column=0, pady=(2, padding['inner']), padx=padding['inner'], sticky="w")
     
     def create_format_selection_horizontal(self, parent, fonts, padding):
         """Create horizontal format selection for larger screens"""
-        format_frame = ctk.CTkFrame(parent) if self.using_ctk else ttk.LabelFrame(parent, text="Output Formats")
+        format_frame = self.create_titled_frame(parent, "Output Formats", self._fonts['bold'], padding)
         format_frame.grid(row=1, column=0, sticky="ew", pady=(0, padding['inner']))
         format_frame.grid_columnconfigure((0, 1, 2), weight=1)
         
-        if self.using_ctk:
-            format_label = ctk.CTkLabel(
-                format_frame,
-                text="Output Formats:",
-                font=ctk.CTkFont(weight="bold")
-            )
-            format_label.grid(row=0, column=0, columnspan=3, pady=(padding['inner'], 5))
-            
-            self.csv_checkbox = ctk.CTkCheckBox(
-                format_frame,
-                text="CSV",
-                variable=self.csv_var
-            )
-            self.csv_checkbox.grid(row=1, column=0, pady=5, padx=padding['inner'])
-            
-            self.asc_checkbox = ctk.CTkCheckBox(
-                format_frame,
-                text="ASC (Vector)",
-                variable=self.asc_var
-            )
-            self.asc_checkbox.grid(row=1, column=1, pady=5, padx=padding['inner'])
-            
-            self.trc_checkbox = ctk.CTkCheckBox(
-                format_frame,
-                text="TRC (PEAK)",
-                variable=self.trc_var
-            )
-            self.trc_checkbox.grid(row=1, column=2, pady=(5, padding['inner']), padx=padding['inner'])
-        else:
-            checkbox_frame = ttk.Frame(format_frame)
-            checkbox_frame.grid(row=0, column=0, sticky="ew")
-            checkbox_frame.grid_columnconfigure((0, 1, 2), weight=1)
-            
-            self.csv_checkbox = ttk.Checkbutton(
-                checkbox_frame,
-                text="CSV",
-                variable=self.csv_var
-            )
-            self.csv_checkbox.grid(row=0, column=0, sticky="w")
-            
-            self.asc_checkbox = ttk.Checkbutton(
-                checkbox_frame,
-                text="ASC (Vector)",
-                variable=self.asc_var
-            )
-            self.asc_checkbox.grid(row=0, column=1, sticky="w")
-            
-            self.trc_checkbox = ttk.Checkbutton(
-                checkbox_frame,
-                text="TRC (PEAK)",
-                variable=self.trc_var
-            )
-            self.trc_checkbox.grid(row=0, column=2, sticky="w")
+        self.csv_checkbox = self.create_widget(
+            "CheckBox",
+            format_frame,
+            text="CSV",
+            variable=self.csv_var
+        )
+        self.csv_checkbox.grid(row=1, column=0, pady=5, padx=padding['inner'])
+        
+        self.asc_checkbox = self.create_widget(
+            "CheckBox",
+            format_frame,
+            text="ASC (Vector)",
+            variable=self.asc_var
+        )
+        self.asc_checkbox.grid(row=1, column=1, pady=5, padx=padding['inner'])
+        
+        self.trc_checkbox = self.create_widget(
+            "CheckBox",
+            format_frame,
+            text="TRC (PEAK)",
+            variable=self.trc_var
+        )
+        self.trc_checkbox.grid(row=1, column=2, pady=5, padx=padding['inner'])
     
     def create_directory_selection(self, parent, fonts, padding):
         """Create responsive directory selection"""
-        dir_frame = ctk.CTkFrame(parent) if self.using_ctk else ttk.LabelFrame(parent, text="Output Directory")
+        dir_frame = self.create_titled_frame(parent, "Output Directory", self._fonts['bold'], padding)
         dir_frame.grid(row=2, column=0, sticky="ew", pady=(0, padding['inner']))
         dir_frame.grid_columnconfigure(0, weight=1)
         
-        if self.using_ctk:
-            dir_label = ctk.CTkLabel(
-                dir_frame,
-                text="Output Directory:",
-                font=ctk.CTkFont(weight="bold")
-            )
-            dir_label.grid(row=0, column=0, pady=(padding['inner'], 5), sticky="w")
-            
-            dir_select_frame = ctk.CTkFrame(dir_frame)
-            dir_select_frame.grid(row=1, column=0, sticky="ew", padx=padding['inner'], pady=(0, padding['inner']))
-            dir_select_frame.grid_columnconfigure(0, weight=1)
-            
-            self.dir_entry = ctk.CTkEntry(
-                dir_select_frame,
-                textvariable=self.output_directory,
-                placeholder_text="Select output directory..."
-            )
-            self.dir_entry.grid(row=0, column=0, sticky="ew", padx=(0, padding['inner']//2))
-            
-            self.dir_browse_btn = ctk.CTkButton(
-                dir_select_frame,
-                text="Browse",
-                command=self.select_output_directory,
-                width=80
-            )
-            self.dir_browse_btn.grid(row=0, column=1)
-        else:
-            dir_select_frame = ttk.Frame(dir_frame)
-            dir_select_frame.grid(row=0, column=0, sticky="ew")
-            dir_select_frame.grid_columnconfigure(0, weight=1)
-            
-            self.dir_entry = ttk.Entry(
-                dir_select_frame,
-                textvariable=self.output_directory
-            )
-            self.dir_entry.grid(row=0, column=0, sticky="ew", padx=(0, padding['inner']//2))
-            
-            self.dir_browse_btn = ttk.Button(
-                dir_select_frame,
-                text="Browse",
-                command=self.select_output_directory
-            )
-            self.dir_browse_btn.grid(row=0, column=1)
+        dir_select_frame = self.create_widget("Frame", dir_frame)
+        dir_select_frame.grid(row=1, column=0, sticky="ew", padx=padding['inner'], pady=(0, padding['inner']))
+        dir_select_frame.grid_columnconfigure(0, weight=1)
+        
+        self.dir_entry = self.create_widget(
+            "Entry",
+            dir_select_frame,
+            textvariable=self.output_directory,
+            **self._styles['dir_entry']
+        )
+        self.dir_entry.grid(row=0, column=0, sticky="ew", padx=(0, padding['inner']//2))
+        
+        self.dir_browse_btn = self.create_widget(
+            "Button",
+            dir_select_frame,
+            text=BTN_BROWSE,
+            command=self.select_output_directory,
+            **self._styles['browse_button']
+        )
+        self.dir_browse_btn.grid(row=0, column=1)
+        self._toggleable_btns.append(self.dir_browse_btn)
     
     def create_responsive_progress_section(self, fonts, padding):
         """Create responsive progress section"""
         row_num = 3
         
+        progress_frame = self.create_titled_frame(
+            self.container, "Conversion Progress", self._fonts['section'], padding
+        )
+        progress_frame.grid(row=row_num, column=0, sticky="ew", pady=(0, padding['section']))
+        progress_frame.grid_columnconfigure(0, weight=1)
+        
+        self.progress_bar = self.create_widget("ProgressBar", progress_frame, **self._styles['progress_bar'])
+        self.progress_bar.grid(row=1, column=0, sticky="ew", padx=padding['inner'], pady=(0, padding['inner']//2))
         if self.using_ctk:
-            progress_frame = ctk.CTkFrame(self.container)
-            progress_frame.grid(row=row_num, column=0, sticky="ew", pady=(0, padding['section']))
-            progress_frame.grid_columnconfigure(0, weight=1)
-            
-            section_label = ctk.CTkLabel(
-                progress_frame,
-                text="Conversion Progress",
-                font=ctk.CTkFont(size=fonts['section'], weight="bold")
-            )
-            section_label.grid(row=0, column=0, pady=(padding['inner'], padding['inner']//2))
-            
-            self.progress_bar = ctk.CTkProgressBar(progress_frame)
-            self.progress_bar.grid(row=1, column=0, sticky="ew", padx=padding['inner'], pady=(0, padding['inner']//2))
             self.progress_bar.set(0)
-            
-            self.status_label = ctk.CTkLabel(
-                progress_frame,
-                textvariable=self.status_var,
-                font=ctk.CTkFont(size=fonts['normal']),
-                wraplength=400 if not self.screen_info['is_small'] else 300
-            )
-            self.status_label.grid(row=2, column=0, pady=(0, padding['inner']))
-        else:
-            progress_frame = ttk.LabelFrame(self.container, text="Conversion Progress", padding=str(padding['inner']))
-            progress_frame.grid(row=row_num, column=0, sticky="ew", pady=(0, padding['section']))
-            progress_frame.grid_columnconfigure(0, weight=1)
-            
-            self.progress_bar = ttk.Progressbar(
-                progress_frame,
-                variable=self.progress_var,
-                maximum=100,
-                mode='determinate'
-            )
-            self.progress_bar.grid(row=0, column=0, sticky="ew", pady=(0, padding['inner']))
-            
-            self.status_label = ttk.Label(
-                progress_frame,
-                textvariable=self.status_var,
-                font=("Arial", fonts['normal']),
-                wraplength=400 if not self.screen_info['is_small'] else 300
-            )
-            self.status_label.grid(row=1, column=0)
+        
+        self.status_label = self.create_widget(
+            "Label",
+            progress_frame,
+            textvariable=self.status_var,
+            font=self._fonts['body'],
+            wraplength=400 if not self.screen_info['is_small'] else 300
+        )
+        self.status_label.grid(row=2, column=0, pady=(0, padding['inner']))
     
     def create_responsive_action_buttons(self, fonts, padding):
         """Create responsive action buttons"""
         row_num = 4
         
-        button_frame = ctk.CTkFrame(self.container) if self.using_ctk else ttk.Frame(self.container)
+        button_frame = self.create_widget("Frame", self.container)
         button_frame.grid(row=row_num, column=0, sticky="ew", pady=(0, padding['outer']))
         
+        self.convert_btn = self.create_widget(
+            "Button",
+            button_frame,
+            text=BTN_CONVERT,
+            command=self.start_conversion,
+            **self._styles['primary_button']
+        )
+        self._toggleable_btns.append(self.convert_btn)
+        
+        self.info_btn = self.create_widget(
+            "Button",
+            button_frame,
+            text=BTN_ABOUT,
+            command=self.show_about_info,
+            **self._styles['action_button']
+        )
+        
+        self.exit_btn = self.create_widget(
+            "Button",
+            button_frame,
+            text=BTN_EXIT,
+            command=self.on_closing,
+            **self._styles['action_button']
+        )
+        
         # Responsive button layout
         if self.screen_info['is_small']:
             # Vertical layout for small screens
             button_frame.grid_columnconfigure(0, weight=1)
             
-            button_height = 40
-            button_width = 200
-            
-            if self.using_ctk:
-                self.convert_btn = ctk.CTkButton(
-                    button_frame,
-                    text="🚀 Convert Files",
-                    command=self.start_conversion,
-                    height=button_height,
-                    width=button_width,
-                    font=ctk.CTkFont(size=fonts['normal']+2, weight="bold")
-                )
-                self.convert_btn.grid(row=0, column=0, pady=padding['inner']//2)
-                
-                self.info_btn = ctk.CTkButton(
-                    button_frame,
-                    text="ℹ️ About",
-                    command=self.show_about_info,
-                    height=button_height,
-                    width=button_width
-                )
-                self.info_btn.grid(row=1, column=0, pady=padding['inner']//2)
-                
-                self.exit_btn = ctk.CTkButton(
-                    button_frame,
-                    text="❌ Exit",
-                    command=self.on_closing,
-                    height=button_height,
-                    width=button_width
-                )
-                self.exit_btn.grid(row=2, column=0, pady=padding['inner']//2)
-            else:
-                self.convert_btn = ttk.Button(
-                    button_frame,
-                    text="🚀 Convert Files",
-                    command=self.start_conversion
-                )
-                self.convert_btn.grid(row=0, column=0, pady=padding['inner']//2)
-                
-                self.info_btn = ttk.Button(
-                    button_frame,
-                    text="ℹ️ About",
-                    command=self.show_about_info
-                )
-                self.info_btn.grid(row=1, column=0, pady=padding['inner']//2)
-                
-                self.exit_btn = ttk.Button(
-                    button_frame,
-                    text="❌ Exit",
-                    command=self.on_closing
-                )
-                self.exit_btn.grid(row=2, column=0, pady=padding['inner']//2)
+            self.convert_btn.grid(row=0, column=0, pady=padding['inner']//2)
+            self.info_btn.grid(row=1, column=0, pady=padding['inner']//2)
+            self.exit_btn.grid(row=2, column=0, pady=padding['inner']//2)
         else:
             # Horizontal layout for larger screens
             button_frame.grid_columnconfigure(1, weight=1)  # Center space
             
-            button_height = 50
-            
-            if self.using_ctk:
-                self.convert_btn = ctk.CTkButton(
-                    button_frame,
-                    text="🚀 Convert Files",
-                    command=self.start_conversion,
-                    height=button_height,
-                    font=ctk.CTkFont(size=fonts['normal']+2, weight="bold")
-                )
-                self.convert_btn.grid(row=0, column=0, padx=(0, padding['inner']), pady=padding['inner'])
-                
-                self.info_btn = ctk.CTkButton(
-                    button_frame,
-                    text="ℹ️ About",
-                    command=self.show_about_info,
-                    height=button_height
-                )
-                self.info_btn.grid(row=0, column=2, padx=(0, padding['inner']), pady=padding['inner'])
-                
-                self.exit_btn = ctk.CTkButton(
-                    button_frame,
-                    text="❌ Exit",
-                    command=self.on_closing,
-                    height=button_height
-                )
-                self.exit_btn.grid(row=0, column=3, pady=padding['inner'])
-            else:
-                self.convert_btn = ttk.Button(
-                    button_frame,
-                    text="🚀 Convert Files",
-                    command=self.start_conversion
-                )
-                self.convert_btn.grid(row=0, column=0, padx=(0, padding['inner']), pady=padding['inner'])
-                
-                self.info_btn = ttk.Button(
-                    button_frame,
-                    text="ℹ️ About",
-                    command=self.show_about_info
-                )
-                self.info_btn.grid(row=0, column=2, padx=(0, padding['inner']), pady=padding['inner'])
-                
-                self.exit_btn = ttk.Button(
-                    button_frame,
-                    text="❌ Exit",
-                    command=self.on_closing
-                )
-                self.exit_btn.grid(row=0, column=3, pady=padding['inner'])
+            self.convert_btn.grid(row=0, column=0, padx=(0, padding['inner']), pady=padding['inner'])
+            self.info_btn.grid(row=0, column=2, padx=(0, padding['inner']), pady=padding['inner'])
+            self.exit_btn.grid(row=0, column=3, pady=padding['inner'])
         
     def select_files(self):
         """Open file dialog to select MDF4 files with improved error handling"""
@@ -794,55 +751,169 @@ class MF4BridgeGUI:
             files = filedialog.askopenfilenames(
                 title="Select MDF4 Files",
                 filetypes=file_types,
+                initialdir=self._last_input_dir,
                 parent=self.root
             )
             
             if files:
+                self._last_input_dir = os.path.dirname(files[0])
                 self.add_files(files)
         except Exception as e:
             logger.error(f"Error in file selection: {e}")
             messagebox.showerror("File Selection Error", f"Could not open file dialog: {str(e)}")
             
     def add_files(self, file_paths):
-        """Add files to the file list with improved validation"""
-        added_count = 0
-        errors = []
+        """Queue files for background MDF4 validation"""
+        invalid_ext = []
+        futures = {}
         
         try:
             for file_path in file_paths:
-                if file_path not in self.selected_files:
-                    if validate_file_extension(file_path, ['.mf4', '.MF4', '.mdf', '.MDF']):
-                        if self.converter.validate_mdf4_file(file_path):
-                            self.selected_files.append(file_path)
-                            added_count += 1
-                        else:
-                            errors.append(f"{os.path.basename(file_path)} - Invalid MDF4 file")
+                if file_path not in self._selected_set:
+                    if file_path.lower().endswith(self._VALID_EXTS):
+                        # Reserve the path now so re-selecting it while pending is a no-op
+                        self._selected_set.add(file_path)
+                        futures[file_path] = self._validation_pool.submit(
+                            self._validate_file, file_path
+                        )
                     else:
-                        errors.append(f"{os.path.basename(file_path)} - Invalid file extension")
+                        invalid_ext.append(os.path.basename(file_path))
                 else:
                     logger.debug(f"File already selected: {file_path}")
             
+            if futures:
+                # Show pending files straight away; their rows are filled in as validation finishes
+                self._insert_rows([
+                    (file_path, (os.path.basename(file_path), "…", "Validating..."))
+                    for file_path in futures
+                ])
+                if not self.is_converting:
+                    self.status_var.set(f"Validating {len(futures)} file(s)...")
+                self._pending_validation_batches += 1
+                batch = {
+                    'futures': futures,
+                    'added': 0,
+                    'invalid_ext': invalid_ext,
+                    'invalid_mdf': [],
+                    'generation': self._validation_generation
+                }
+                self.root.after(50, self._poll_validation, batch)
+            elif invalid_ext:
+                self.show_skipped_files(invalid_ext, [])
+                
+        except Exception as e:
+            logger.error(f"Error adding files: {e}")
+            messagebox.showerror("Error", f"Error adding files: {str(e)}")
+    
+    def _validate_file(self, file_path: str):
+        """Validate an MDF4 file and read its size (runs on the validation pool)"""
+        stat = os.stat(file_path)
+        fingerprint = (stat.st_mtime_ns, stat.st_size)
+        
+        with self._validation_cache_lock:
+            cached = self._validation_cache.get(file_path)
+            if cached is not None and cached[0] == fingerprint:
+                self._validation_cache.move_to_end(file_path)
+                return cached[1], stat.st_size
+        
+        is_valid = self.converter.validate_mdf4_file(file_path)
+        
+        with self._validation_cache_lock:
+            self._validation_cache[file_path] = (fingerprint, is_valid)
+            self._validation_cache.move_to_end(file_path)
+            if len(self._validation_cache) > self.VALIDATION_CACHE_SIZE:
+                self._validation_cache.popitem(last=False)
+        return is_valid, stat.st_size
+    
+    def _poll_validation(self, batch):
+        """Add validated files in selection order and reschedule until the batch is done"""
+        # Files cleared while this batch was pending are dropped
+        if batch['generation'] != self._validation_generation:
+            return
+        
+        futures = batch['futures']
+        added_count = 0
+        rescheduled = False
+        
+        try:
+            while futures:
+                file_path, future = next(iter(futures.items()))
+                if not future.done():
+                    break
+                del futures[file_path]
+                
+                try:
+                    is_valid, file_size = future.result()
+                except Exception as e:
+                    logger.warning(f"Error validating file {file_path}: {e}")
+                    is_valid = False
+                
+                if is_valid:
+                    self.selected_files.append(file_path)
+                    self._file_meta[file_path] = (os.path.basename(file_path), format_file_size(file_size))
+                    self._file_sizes[file_path] = file_size
+                    self._total_input_bytes += file_size
+                    added_count += 1
+                else:
+                    self._selected_set.discard(file_path)
+                    if self.file_tree.exists(file_path):
+                        self.file_tree.delete(file_path)
+                    batch['invalid_mdf'].append(os.path.basename(file_path))
+            
             if added_count > 0:
+                batch['added'] += added_count
                 self.update_file_list()
                 self.update_file_count()
-                self.status_var.set(f"Added {added_count} file(s). Total: {len(self.selected_files)} files selected.")
             
-            if errors:
-                error_msg = "Some files could not be added:\n" + "\n".join(errors[:5])
-                if len(errors) > 5:
-                    error_msg += f"\n... and {len(errors) - 5} more"
-                messagebox.showwarning("File Validation Issues", error_msg)
+            if futures:
+                self.root.after(50, self._poll_validation, batch)
+                rescheduled = True
+                return
+            
+            # The status label belongs to the progress display while a conversion runs
+            if not self.is_converting:
+                if batch['added'] > 0:
+                    self.status_var.set(f"Added {batch['added']} file(s). Total: {len(self.selected_files)} files selected.")
+                else:
+                    self.status_var.set("Ready - Select MDF4 files to begin")
+            
+            if batch['invalid_ext'] or batch['invalid_mdf']:
+                self.show_skipped_files(batch['invalid_ext'], batch['invalid_mdf'])
                 
         except Exception as e:
-            logger.error(f"Error adding files: {e}")
-            messagebox.showerror("Error", f"Error adding files: {str(e)}")
+            logger.error(f"Error processing validation results: {e}")
+        finally:
+            if not rescheduled:
+                self._pending_validation_batches -= 1
+    
+    def show_skipped_files(self, invalid_ext: List[str], invalid_mdf: List[str]):
+        """Show one warning listing skipped files grouped by reason"""
+        sections = []
+        for heading, names in (("Invalid extension", invalid_ext), ("Not a valid MDF4 file", invalid_mdf)):
+            if names:
+                listing = "\n  ".join(names[:5])
+                if len(names) > 5:
+                    listing += f"\n  ... and {len(names) - 5} more"
+                sections.append(f"{heading}:\n  {listing}")
+        
+        messagebox.showwarning(
+            "Some files skipped",
+            "The following files were skipped:\n\n" + "\n\n".join(sections)
+        )
             
     def clear_files(self):
         """Clear all selected files with confirmation"""
-        if self.selected_files:
-            if messagebox.askyesno("Clear Files", f"Remove all {len(self.selected_files)} selected files?"):
+        # The set also holds files still being validated
+        if self._selected_set:
+            if messagebox.askyesno("Clear Files", f"Remove all {len(self._selected_set)} selected files?"):
+                self._validation_generation += 1
+                self._pending_validation_batches = 0
                 self.selected_files.clear()
-                self.update_file_list()
+                self._selected_set.clear()
+                self._file_meta.clear()
+                self._file_sizes.clear()
+                self._total_input_bytes = 0
+                self.clear_file_list()
                 self.update_file_count()
                 self.status_var.set("Ready - Select MDF4 files to begin")
         
@@ -856,41 +927,61 @@ class MF4BridgeGUI:
         else:
             text = f"{count} files selected"
         
-        if hasattr(self, 'file_count_label'):
-            if self.using_ctk:
-                self.file_count_label.configure(text=text)
-            else:
-                self.file_count_label.config(text=text)
+        self.file_count_label.configure(text=text)
         
     def update_file_list(self):
-        """Update the file list display with status information"""
+        """Fill in rows for files added since the last update"""
         try:
-            # Clear existing items
-            for item in self.file_tree.get_children():
-                self.file_tree.delete(item)
+            # Only the new tail needs rendering; names and sizes are cached on validation
+            missing_rows = []
+            for file_path in self.selected_files[self._rendered_count:]:
+                values = self._file_meta.get(file_path, (os.path.basename(file_path), "Error")) + ("Ready",)
+                if self.file_tree.exists(file_path):
+                    self.file_tree.item(file_path, values=values)
+                else:
+                    missing_rows.append((file_path, values))
             
-            # Add files to tree
-            for file_path in self.selected_files:
-                try:
-                    file_name = os.path.basename(file_path)
-                    file_size = format_file_size(os.path.getsize(file_path))
-                    status = "Ready"
-                    
-                    self.file_tree.insert("", "end", values=(file_name, file_size, status))
-                except Exception as e:
-                    logger.warning(f"Error processing file {file_path}: {e}")
-                    self.file_tree.insert("", "end", values=(os.path.basename(file_path), "Error", "Invalid"))
+            if missing_rows:
+                self._insert_rows(missing_rows)
+            
+            self._rendered_count = len(self.selected_files)
         except Exception as e:
             logger.error(f"Error updating file list: {e}")
+    
+    def _insert_rows(self, rows):
+        """Insert (path, values) rows keyed by path, unmapping the tree for large batches"""
+        # Unmapped, Tk lays the tree out once rather than once per row
+        detach = len(rows) > self.BULK_INSERT_THRESHOLD
+        if detach:
+            self.file_tree.grid_remove()
+        
+        try:
+            for file_path, values in rows:
+                self.file_tree.insert("", "end", iid=file_path, values=values)
+        finally:
+            if detach:
+                self.file_tree.grid()
+    
+    def clear_file_list(self):
+        """Remove all rows from the file list display"""
+        try:
+            children = self.file_tree.get_children()
+            if children:
+                self.file_tree.delete(*children)
+            self._rendered_count = 0
+        except Exception as e:
+            logger.error(f"Error clearing file list: {e}")
         
     def select_output_directory(self):
         """Open dialog to select output directory"""
         try:
             directory = filedialog.askdirectory(
                 title="Select Output Directory",
+                initialdir=self._last_output_dir,
                 parent=self.root
             )
             if directory:
+                self._last_output_dir = directory
                 self.output_directory.set(directory)
                 validation = validate_output_directory(directory)
                 if validation['valid']:
@@ -901,30 +992,36 @@ class MF4BridgeGUI:
             logger.error(f"Error selecting output directory: {e}")
             messagebox.showerror("Directory Selection Error", f"Could not open directory dialog: {str(e)}")
                 
-    def validate_inputs(self) -> bool:
+    def validate_inputs(self, formats: Optional[List[str]] = None, output_dir: Optional[str] = None) -> bool:
         """Validate user inputs before conversion with detailed feedback"""
         try:
+            # Callers that already read the Tk variables pass them in to avoid re-reading
+            if formats is None:
+                formats = self.get_selected_formats()
+            if output_dir is None:
+                output_dir = self.output_directory.get()
+            
             if not self.selected_files:
                 messagebox.showerror("No Files", "Please select at least one MDF4 file.")
                 return False
                 
-            if not (self.csv_var.get() or self.asc_var.get() or self.trc_var.get()):
+            if not formats:
                 messagebox.showerror("No Format", "Please select at least one output format.")
                 return False
                 
-            if not self.output_directory.get():
+            if not output_dir:
                 messagebox.showerror("No Output Directory", "Please select an output directory.")
                 return False
                 
             # Validate output directory
-            validation = validate_output_directory(self.output_directory.get())
+            validation = validate_output_directory(output_dir)
             if not validation['valid']:
                 messagebox.showerror("Invalid Output Directory", validation['error_message'])
                 return False
             
             # Check disk space if available
             if validation.get('free_space', 0) > 0:
-                estimated_size = len(self.selected_files) * 10 * 1024 * 1024  # Rough estimate: 10MB per file
+                estimated_size = self.estimate_output_size(formats)
                 if validation['free_space'] < estimated_size:
                     result = messagebox.askyesno(
                         "Low Disk Space",
@@ -943,6 +1040,52 @@ class MF4BridgeGUI:
             messagebox.showerror("Validation Error", f"Error validating inputs: {str(e)}")
             return False
         
+    def estimate_output_size(self, formats: List[str]) -> int:
+        """Estimate total output size from the input sizes and per-format ratios"""
+        multiplier = sum(self._format_multipliers.get(fmt, 1.0) for fmt in formats)
+        return int(self._total_input_bytes * multiplier)
+    
+    def _load_format_multipliers(self) -> dict:
+        """Load per-format size ratios learned in previous sessions"""
+        multipliers = dict(self.DEFAULT_FORMAT_MULTIPLIERS)
+        saved = load_settings().get('format_size_multipliers', {})
+        
+        if isinstance(saved, dict):
+            for fmt, value in saved.items():
+                if fmt in multipliers and isinstance(value, (int, float)) and value > 0:
+                    multipliers[fmt] = float(value)
+        
+        return multipliers
+    
+    def update_format_multipliers(self, results: dict):
+        """Learn per-format size ratios from a completed batch and persist them"""
+        if not self.asammdf_available:
+            return  # Demo data sizes say nothing about real MDF4 files
+        
+        try:
+            totals = {}
+            for conversion in results['successful']:
+                input_size = self._file_sizes.get(conversion['input_file'], 0)
+                if input_size > 0:
+                    output_total, input_total = totals.get(conversion['format'], (0, 0))
+                    totals[conversion['format']] = (
+                        output_total + conversion['file_size'],
+                        input_total + input_size
+                    )
+            
+            if not totals:
+                return
+            
+            for fmt, (output_total, input_total) in totals.items():
+                self._format_multipliers[fmt] = output_total / input_total
+            
+            settings = load_settings()
+            settings['format_size_multipliers'] = self._format_multipliers
+            save_settings(settings)
+            
+        except Exception as e:
+            logger.debug(f"Could not update format size multipliers: {e}")
+    
     def get_selected_formats(self) -> List[str]:
         """Get list of selected output formats"""
         formats = []
@@ -959,8 +1102,20 @@ class MF4BridgeGUI:
         if self.is_converting:
             messagebox.showwarning("Conversion in Progress", "A conversion is already in progress.")
             return
+        
+        # Files still being validated are not in selected_files yet and would be left out
+        if self._pending_validation_batches:
+            messagebox.showwarning(
+                "Validation in Progress",
+                "Some files are still being validated.\n\nPlease wait for validation to finish before converting."
+            )
+            return
             
-        if not self.validate_inputs():
+        # Read the Tk variables once for validation and the worker thread
+        formats = self.get_selected_formats()
+        output_dir = self.output_directory.get()
+        
+        if not self.validate_inputs(formats, output_dir):
             return
             
         try:
@@ -968,16 +1123,12 @@ class MF4BridgeGUI:
             self.set_conversion_state(True)
             
             # Create output directory if it doesn't exist
-            create_output_directory(self.output_directory.get())
-            
-            # Start conversion in separate thread
-            formats = self.get_selected_formats()
-            self.conversion_thread = threading.Thread(
-                target=self.run_conversion,
-                args=(self.selected_files.copy(), self.output_directory.get(), formats),
-                daemon=True
+            create_output_directory(output_dir)
+            
+            # Start conversion on the worker thread; run_conversion reports back via root.after
+            self.conversion_future = self._conv_pool.submit(
+                self.run_conversion, self.selected_files.copy(), output_dir, formats
             )
-            self.conversion_thread.start()
             
         except Exception as e:
             logger.error(f"Error starting conversion: {e}")
@@ -991,23 +1142,9 @@ class MF4BridgeGUI:
         
         try:
             # Update button states and text
-            widgets_to_update = [
-                (self.convert_btn, "Converting..." if converting else "🚀 Convert Files"),
-                (self.select_files_btn, None),
-                (self.clear_files_btn, None),
-                (self.dir_browse_btn, None)
-            ]
-            
-            for widget, new_text in widgets_to_update:
-                if hasattr(widget, 'configure'):
-                    if self.using_ctk:
-                        widget.configure(state=state)
-                        if new_text:
-                            widget.configure(text=new_text)
-                    else:
-                        widget.configure(state=state)
-                        if new_text:
-                            widget.configure(text=new_text)
+            for button in self._toggleable_btns:
+                button.configure(state=state)
+            self.convert_btn.configure(text=BTN_CONVERTING if converting else BTN_CONVERT)
             
             # Reset progress if starting conversion
             if converting:
@@ -1025,7 +1162,11 @@ class MF4BridgeGUI:
             # Update file statuses to "Processing"
             self.root.after(0, self.update_file_statuses, "Processing")
             
-            results = self.converter.batch_convert(file_list, output_dir, formats)
+            # MDF4 decoding is CPU-bound, so spread multi-file batches across processes
+            if len(file_list) > 1:
+                results = self.converter.convert_files_in_processes(file_list, output_dir, formats)
+            else:
+                results = self.converter.batch_convert(file_list, output_dir, formats)
             
             # Update UI in main thread
             self.root.after(0, self.conversion_completed, results)
@@ -1039,6 +1180,9 @@ class MF4BridgeGUI:
         """Update status for all files in the tree"""
         try:
             for item in self.file_tree.get_children():
+                # Rows still being validated keep their "Validating..." status
+                if item not in self._file_meta:
+                    continue
                 values = list(self.file_tree.item(item, "values"))
                 if len(values) >= 3:
                     values[2] = status
@@ -1049,6 +1193,8 @@ class MF4BridgeGUI:
     def conversion_completed(self, results: dict):
         """Handle conversion completion with detailed results"""
         try:
+            self._discard_pending_progress()
+            
             # Re-enable UI
             self.set_conversion_state(False)
             
@@ -1061,6 +1207,9 @@ class MF4BridgeGUI:
             # Update file statuses
             self.update_completion_statuses(results)
             
+            # Refine disk space estimates for the next batch
+            self.update_format_multipliers(results)
+            
             # Show completion message
             successful = len(results['successful'])
             failed = len(results['failed'])
@@ -1110,6 +1259,8 @@ class MF4BridgeGUI:
             failed_files = {os.path.basename(r['input_file']): r for r in results['failed']}
             
             for item in self.file_tree.get_children():
+                if item not in self._file_meta:
+                    continue
                 values = list(self.file_tree.item(item, "values"))
                 if len(values) >= 3:
                     file_name = values[0]
@@ -1129,6 +1280,8 @@ class MF4BridgeGUI:
     def conversion_error(self, error_msg: str):
         """Handle conversion error with cleanup"""
         try:
+            self._discard_pending_progress()
+            
             # Re-enable UI
             self.set_conversion_state(False)
             
@@ -1152,21 +1305,54 @@ class MF4BridgeGUI:
     def update_progress(self, message: str, percentage: float):
         """Update progress bar and status (called from converter)"""
         try:
-            # Update UI in main thread
-            self.root.after(0, self._update_progress_ui, message, percentage)
+            # Only the latest update matters; flush at once if the last repaint
+            # is old enough, otherwise when the interval runs out
+            with self._progress_lock:
+                self._pending_progress = (message, percentage)
+                if self._progress_scheduled:
+                    return
+                self._progress_scheduled = True
+                wait = self._last_progress_ts + self.PROGRESS_INTERVAL - time.monotonic()
+            
+            if wait > 0:
+                self.root.after(int(wait * 1000) + 1, self._flush_progress)
+            else:
+                self.root.after_idle(self._flush_progress)
         except Exception as e:
             logger.error(f"Error scheduling progress update: {e}")
+    
+    def _flush_progress(self):
+        """Apply the most recent pending progress update in the main thread"""
+        with self._progress_lock:
+            pending = self._pending_progress
+            self._pending_progress = None
+            self._progress_scheduled = False
+            self._last_progress_ts = time.monotonic()
+        
+        if pending is not None:
+            self._update_progress_ui(*pending)
+    
+    def _discard_pending_progress(self):
+        """Drop queued progress so it cannot overwrite a final status"""
+        with self._progress_lock:
+            self._pending_progress = None
+        self._last_progress = (None, -1.0)
         
     def _update_progress_ui(self, message: str, percentage: float):
         """Update progress UI elements safely"""
+        # Repeated ticks would only re-fire the Tcl variable traces
+        if (message, percentage) == self._last_progress:
+            return
+        
         try:
+            self._last_progress = (message, percentage)
+            
             if self.using_ctk:
                 self.progress_bar.set(percentage / 100.0)
             else:
                 self.progress_var.set(percentage)
                 
             self.status_var.set(message)
-            self.root.update_idletasks()
             
         except Exception as e:
             logger.error(f"Error updating progress UI: {e}")
@@ -1174,12 +1360,10 @@ class MF4BridgeGUI:
     def show_about_info(self):
         """Show enhanced information about the application"""
         try:
-            from converter_engine import ASAMMDF_AVAILABLE
-            
             # Get system info
             sys_info = get_system_info()
             
-            if ASAMMDF_AVAILABLE:
+            if self.asammdf_available:
                 mode_info = "✅ Full Mode - Real MDF4 processing enabled"
                 features = [
                     "✅ Process real MDF4 files from CANedge loggers",
@@ -1221,19 +1405,25 @@ class MF4BridgeGUI:
     
     def setup_cleanup(self):
         """Setup automatic cleanup and memory management"""
-        def cleanup_task():
-            try:
-                # Clean up temporary files
-                from utils import cleanup_temp_files
-                cleanup_temp_files()
-                
-                # Schedule next cleanup in 30 minutes
-                self.root.after(30 * 60 * 1000, cleanup_task)
-            except Exception as e:
-                logger.debug(f"Cleanup task error: {e}")
+        # Temp-file scans run on a daemon timer so slow disks never stall the Tk loop
+        self._cleanup_timer = None
+        self._schedule_cleanup(5 * 60)  # First cleanup after 5 minutes
+    
+    def _schedule_cleanup(self, delay_seconds: float):
+        """Schedule the next background cleanup run"""
+        self._cleanup_timer = threading.Timer(delay_seconds, self._bg_cleanup)
+        self._cleanup_timer.daemon = True
+        self._cleanup_timer.start()
+    
+    def _bg_cleanup(self):
+        """Clean up temporary files in the background and reschedule"""
+        try:
+            cleanup_temp_files()
+        except Exception as e:
+            logger.debug(f"Cleanup task error: {e}")
         
-        # Start cleanup task
-        self.root.after(5 * 60 * 1000, cleanup_task)  # First cleanup after 5 minutes
+        # Schedule next cleanup in 30 minutes
+        self._schedule_cleanup(30 * 60)
     
     def on_closing(self):
         """Handle window closing with cleanup"""
@@ -1252,9 +1442,14 @@ class MF4BridgeGUI:
                 if hasattr(self.converter, 'cancel_conversion'):
                     self.converter.cancel_conversion()
             
+            # Stop the background cleanup timer and pending validations
+            if self._cleanup_timer is not None:
+                self._cleanup_timer.cancel()
+            self._validation_pool.shutdown(wait=False)
+            self._conv_pool.shutdown(wait=False)
+            
             # Cleanup
             try:
-                from utils import cleanup_temp_files
                 cleanup_temp_files()
             except Exception as e:
                 logger.debug(f"Cleanup on exit failed: {e}")
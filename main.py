@@ -9,10 +9,17 @@ License: MIT
 
 import sys
 import os
+import shutil
+import platform
 import tkinter as tk
 from tkinter import messagebox
 import logging
+import logging.handlers
+import queue
+import importlib.util
+import multiprocessing
 import signal
+import threading
 import atexit
 from pathlib import Path
 
@@ -24,21 +31,49 @@ def setup_logging():
     
     log_file = log_dir / "mf4bridge.log"
     
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file, encoding='utf-8'),
-            logging.StreamHandler(sys.stdout)
-        ]
+    # No format string uses thread or process fields, so skip collecting them per record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    
+    formatter = logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
     )
+    file_handler = logging.FileHandler(log_file, encoding='utf-8')
+    stream_handler = logging.StreamHandler(sys.stdout)
+    for handler in (file_handler, stream_handler):
+        handler.setFormatter(formatter)
+    
+    # Records are queued on the calling thread and written out by a listener thread
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, file_handler, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    # Leave the queue handler unformatted so records are formatted once, by the listener
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
     
     return logging.getLogger(__name__)
 
-logger = setup_logging()
+logger = logging.getLogger(__name__)
 
-# Add current directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# Fixed for the life of the process, so compute it once
+IN_VENV = sys.prefix != getattr(sys, "base_prefix", sys.prefix) or hasattr(sys, "real_prefix")
+
+# Add the application directory to path for imports (already there when run as a script)
+_APP_DIR = os.path.dirname(os.path.abspath(__file__))
+if _APP_DIR not in sys.path:
+    sys.path.insert(0, _APP_DIR)
+
+def __getattr__(name):
+    """Resolve MF4BridgeGUI on first access so importing main does not load the GUI (PEP 562)"""
+    if name == "MF4BridgeGUI":
+        from gui_components import MF4BridgeGUI
+        return MF4BridgeGUI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def check_python_version():
     """Ensure minimum Python version requirement with detailed info"""
@@ -63,35 +98,39 @@ def check_python_version():
 
 def check_dependencies():
     """Enhanced dependency checking with performance info"""
+    from utils import get_installed_versions
+    
+    # Versions are reused while the interpreter and site-packages are unchanged; the checks below always run
+    versions = get_installed_versions(['asammdf', 'numpy', 'customtkinter'])
+    
     missing_deps = []
     optional_deps = []
     
     # Check for asammdf (core functionality)
-    try:
-        import asammdf
-        logger.info(f"✓ asammdf {asammdf.__version__} found")
-    except ImportError:
+    asammdf_version = versions['asammdf']
+    if asammdf_version:
+        logger.info(f"✓ asammdf {asammdf_version} found")
+    else:
         logger.warning("✗ asammdf not found - will run in demo mode")
         missing_deps.append('asammdf')
     
     # Check for NumPy compatibility
-    try:
-        import numpy as np
-        numpy_version = np.__version__
+    numpy_version = versions['numpy']
+    if numpy_version:
         if numpy_version.startswith('2.'):
             logger.warning(f"⚠️ NumPy 2.x detected ({numpy_version}) - may cause compatibility issues")
             logger.info("Consider running: pip install 'numpy>=1.20.0,<2.0.0'")
         else:
             logger.info(f"✓ NumPy {numpy_version} - compatible")
-    except ImportError:
+    else:
         logger.warning("✗ NumPy not found - required for asammdf")
         missing_deps.append('numpy')
     
     # Check for CustomTkinter (optional, for better UI)
-    try:
-        import customtkinter
-        logger.info(f"✓ CustomTkinter {customtkinter.__version__} found - enhanced UI available")
-    except ImportError:
+    ctk_version = versions['customtkinter']
+    if ctk_version:
+        logger.info(f"✓ CustomTkinter {ctk_version} found - enhanced UI available")
+    else:
         logger.info("ℹ CustomTkinter not found - using standard tkinter")
         optional_deps.append('customtkinter')
     
@@ -127,21 +166,30 @@ def handle_startup_error(error_type: str, error_msg: str, show_gui: bool = True)
 def create_gui():
     """Create and return the appropriate GUI instance with error handling"""
     try:
-        # Try CustomTkinter first if available
-        try:
-            import customtkinter as ctk
-            from gui_components import MF4BridgeGUI
-            
-            # Set appearance mode and theme
-            ctk.set_appearance_mode("system")
-            ctk.set_default_color_theme("blue")
-            
-            root = ctk.CTk()
-            logger.info("✓ Using CustomTkinter interface")
-            
-        except ImportError:
+        # Import the GUI module once; it binds CustomTkinter lazily
+        from gui_components import MF4BridgeGUI, pin_ctk_theme
+        
+        root = None
+        
+        # Try CustomTkinter first if it is installed, without executing it just to probe
+        if importlib.util.find_spec("customtkinter") is not None:
+            try:
+                import customtkinter as ctk
+                
+                # Set appearance mode and theme before the root window is created
+                pin_ctk_theme()
+                
+                root = ctk.CTk()
+                logger.info("✓ Using CustomTkinter interface")
+            except Exception as e:
+                logger.warning(f"CustomTkinter failed to start, using standard Tkinter: {e}")
+                # Drop the partially initialized package so the GUI does not detect it
+                for module_name in list(sys.modules):
+                    if module_name == "customtkinter" or module_name.startswith("customtkinter."):
+                        del sys.modules[module_name]
+        
+        if root is None:
             # Fall back to standard tkinter
-            from gui_components import MF4BridgeGUI
             root = tk.Tk()
             logger.info("✓ Using standard Tkinter interface")
         
@@ -250,47 +298,34 @@ def setup_cleanup():
     atexit.register(cleanup_on_exit)
 
 def check_system_compatibility():
-    """Check system compatibility and warn about potential issues"""
-    warnings = []
+    """Check system compatibility, warn about potential issues and return the probe results"""
+    info = {'in_venv': IN_VENV, 'system': None, 'release': None, 'free_gb': None}
     
     try:
-        # Check available disk space
-        import shutil
-        free_space = shutil.disk_usage(".").free
-        free_gb = free_space / (1024**3)
-        
-        if free_gb < 1:
-            warnings.append(f"Low disk space: {free_gb:.1f}GB available")
-        
-        # Check if running in virtual environment
-        if hasattr(sys, 'real_prefix') or (hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix):
-            logger.info("✓ Running in virtual environment")
-        else:
-            logger.info("ℹ Running in system Python environment")
-        
-        # Platform-specific checks
-        import platform
-        system = platform.system()
-        logger.info(f"✓ Platform: {system} {platform.release()}")
-        
-        if system == "Darwin":  # macOS
-            # Check for potential tkinter issues on macOS
-            try:
-                root = tk.Tk()
-                root.withdraw()
-                root.destroy()
-            except Exception as e:
-                warnings.append("Tkinter GUI may have issues on this macOS version")
-        
-        if warnings:
-            for warning in warnings:
-                logger.warning(f"⚠️ {warning}")
-                
+        info['free_gb'] = shutil.disk_usage(".").free / (1024**3)
+        info['system'] = platform.system()
+        info['release'] = platform.release()
     except Exception as e:
         logger.debug(f"System compatibility check failed: {e}")
+        return info
+    
+    if IN_VENV:
+        logger.info("✓ Running in virtual environment")
+    else:
+        logger.info("ℹ Running in system Python environment")
+    
+    logger.info(f"✓ Platform: {info['system']} {info['release']}")
+    
+    if info['free_gb'] < 1:
+        logger.warning(f"⚠️ Low disk space: {info['free_gb']:.1f}GB available")
+    
+    return info
 
 def main():
     """Enhanced main application entry point"""
+    # Configure logging at real startup rather than whenever main is imported
+    setup_logging()
+    
     logger.info("=" * 70)
     logger.info("Starting MF4Bridge Enhanced")
     logger.info("=" * 70)
@@ -306,8 +341,17 @@ def main():
         # Setup cleanup handlers
         setup_cleanup()
         
-        # Check dependencies
-        missing_deps, optional_deps = check_dependencies()
+        # Check dependencies on a worker thread while Tk starts up on the main thread
+        dependency_results = []
+        
+        def run_dependency_check():
+            try:
+                dependency_results.append(check_dependencies())
+            except Exception as e:
+                logger.error(f"Dependency check failed: {e}", exc_info=True)
+        
+        dependency_thread = threading.Thread(target=run_dependency_check, name="dependency-check", daemon=True)
+        dependency_thread.start()
         
         # Log startup information
         logger.info(f"Application path: {os.path.dirname(os.path.abspath(__file__))}")
@@ -335,11 +379,17 @@ def main():
         # Setup signal handlers
         setup_signal_handlers(root, app)
         
+        dependency_thread.join()
+        missing_deps, optional_deps = dependency_results[0] if dependency_results else ([], [])
+        
+        # asammdf can be installed yet fail to import (e.g. NumPy 2.x); the converter knows
+        if not app.asammdf_available and 'asammdf' not in missing_deps:
+            logger.warning("✗ asammdf is installed but could not be imported - running in demo mode")
+            missing_deps.append('asammdf')
+        
         # Show dependency info if needed (after GUI loads)
         if missing_deps:
-            demo_info_func = show_dependency_info(missing_deps, optional_deps)
-            if demo_info_func:
-                root.after(1500, demo_info_func)  # Show after 1.5 seconds
+            root.after(1500, show_dependency_info(missing_deps, optional_deps))  # Show after 1.5 seconds
         
         # Log successful startup
         logger.info("✅ MF4Bridge Enhanced started successfully")
@@ -370,4 +420,6 @@ def main():
         logger.info("MF4Bridge Enhanced shutdown complete")
 
 if __name__ == "__main__":
+    # Conversions run in a process pool; needed for frozen Windows builds
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
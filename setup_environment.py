@@ -10,10 +10,14 @@ License: MIT
 import subprocess
 import sys
 import os
-import importlib.util
 import logging
+import threading
+import json
+from collections import deque
 from typing import List, Dict, Tuple, Optional
 
+from utils import get_installed_version, get_installed_versions, clear_dependency_cache
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -55,6 +59,9 @@ class DependencyManager:
             }
         }
         
+        # check_package_availability results, kept until pip changes a package
+        self._availability_cache = {}
+        
     def check_python_version(self) -> bool:
         """Check if Python version meets requirements"""
         min_version = (3, 8)
@@ -70,52 +77,82 @@ class DependencyManager:
     
     def check_package_availability(self, package_name: str) -> Tuple[bool, Optional[str]]:
         """Check if a package is available and get its version"""
+        cached = self._availability_cache.get(package_name)
+        if cached is not None:
+            return cached
+        
         try:
-            spec = importlib.util.find_spec(package_name)
-            if spec is None:
-                return False, None
-                
-            module = importlib.import_module(package_name)
-            version = getattr(module, '__version__', 'unknown')
-            return True, version
-            
-        except ImportError:
-            return False, None
+            # Reads installed metadata without importing the package
+            version = get_installed_version(package_name)
+            result = (version is not None, version)
         except Exception as e:
             logger.debug(f"Error checking {package_name}: {e}")
             return False, None
+        
+        self._availability_cache[package_name] = result
+        return result
+    
+    def _invalidate_dependency_cache(self) -> None:
+        """Drop cached availability after pip has changed installed packages"""
+        # Any install can change dependencies too, so drop every entry
+        self._availability_cache.clear()
+        clear_dependency_cache()
     
     def run_pip_command(self, command: List[str]) -> bool:
         """Run a pip command safely"""
         try:
             # Use the current Python executable (the one running this script)
             python_exe = sys.executable
+            if command and command[0] == "install":
+                # Use wheels when any compatible one exists instead of building newer sdists
+                command = ["install", "--prefer-binary"] + command[1:]
             full_command = [python_exe, "-m", "pip"] + command
             logger.info(f"Running: {' '.join(full_command)}")
             
-            result = subprocess.run(
+            # Stream pip's combined output line by line instead of buffering all of it
+            process = subprocess.Popen(
                 full_command,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 text=True,
-                timeout=300  # 5 minute timeout
+                bufsize=1
             )
             
-            if result.returncode == 0:
-                logger.debug(f"Command output: {result.stdout}")
-                if result.stdout:
-                    logger.info(f"Success: {result.stdout.strip()}")
+            # Reading the pipe blocks, so enforce the 5 minute timeout by killing pip
+            timed_out = threading.Event()
+            
+            def kill_on_timeout():
+                timed_out.set()
+                process.kill()
+            
+            timer = threading.Timer(300, kill_on_timeout)
+            timer.daemon = True
+            timer.start()
+            
+            recent_output = deque(maxlen=20)
+            try:
+                for line in process.stdout:
+                    line = line.rstrip()
+                    if line:
+                        logger.info(f"  {line}")
+                        recent_output.append(line)
+                returncode = process.wait()
+            finally:
+                timer.cancel()
+                process.stdout.close()
+            
+            if timed_out.is_set():
+                logger.error("Pip command timed out after 5 minutes")
+                return False
+            
+            if returncode == 0:
                 return True
             else:
-                logger.error(f"Command failed with return code {result.returncode}")
-                if result.stderr:
-                    logger.error(f"Error output: {result.stderr.strip()}")
-                if result.stdout:
-                    logger.error(f"Standard output: {result.stdout.strip()}")
+                logger.error(f"Command failed with return code {returncode}")
+                if recent_output:
+                    logger.error("Last output lines:\n" + "\n".join(recent_output))
                 return False
                 
-        except subprocess.TimeoutExpired:
-            logger.error("Pip command timed out after 5 minutes")
-            return False
         except FileNotFoundError as e:
             logger.error(f"Python executable not found: {e}")
             logger.error(f"Tried to use: {sys.executable}")
@@ -131,7 +168,10 @@ class DependencyManager:
         logger.info(f"Installing {package_spec}...")
         
         # Try to install the package
-        if self.run_pip_command(["install", package_spec]):
+        installed = self.run_pip_command(["install", package_spec])
+        self._invalidate_dependency_cache()
+        
+        if installed:
             logger.info(f"✓ Successfully installed {package_name}")
             return True
         else:
@@ -142,7 +182,10 @@ class DependencyManager:
         """Uninstall a package"""
         logger.info(f"Uninstalling {package_name}...")
         
-        if self.run_pip_command(["uninstall", "-y", package_name]):
+        uninstalled = self.run_pip_command(["uninstall", "-y", package_name])
+        self._invalidate_dependency_cache()
+        
+        if uninstalled:
             logger.info(f"✓ Successfully uninstalled {package_name}")
             return True
         else:
@@ -157,42 +200,51 @@ class DependencyManager:
             logger.info("NumPy not found - installing compatible version")
             return self.install_package('numpy', '>=1.20.0,<2.0.0')
         
-        logger.info(f"Current NumPy version: {numpy_version}")
+        # Compare the major version numerically; startswith('2.') would misread e.g. '20.0'
+        try:
+            numpy_major = int(numpy_version.split('.')[0])
+        except (AttributeError, ValueError):
+            numpy_major = None
         
-        if numpy_version and numpy_version.startswith('2.'):
-            logger.warning(f"NumPy 2.x detected ({numpy_version}) - downgrading for compatibility")
-            logger.info("This may take a few minutes...")
-            
-            # For NumPy 2.x, we need to force reinstall with compatible versions
-            logger.info("Installing compatible NumPy version...")
-            if not self.run_pip_command(["install", "--upgrade", "--force-reinstall", "numpy>=1.20.0,<2.0.0"]):
-                logger.error("Failed to downgrade NumPy")
-                return False
-            
-            # Check if we need to reinstall pandas and asammdf
-            pandas_available, pandas_version = self.check_package_availability('pandas')
-            if pandas_available:
-                logger.info("Reinstalling pandas for NumPy compatibility...")
-                if not self.run_pip_command(["install", "--upgrade", "--force-reinstall", "pandas>=1.5.0,<3.0.0"]):
-                    logger.warning("Failed to reinstall pandas - may cause issues")
-            
-            asammdf_available, asammdf_version = self.check_package_availability('asammdf')
-            if asammdf_available:
-                logger.info("Reinstalling asammdf for NumPy compatibility...")
-                if not self.run_pip_command(["install", "--upgrade", "--force-reinstall", "asammdf>=7.0.0"]):
-                    logger.warning("Failed to reinstall asammdf - may cause issues")
-            
-            # Verify the fix worked
-            numpy_available, new_numpy_version = self.check_package_availability('numpy')
-            if numpy_available and new_numpy_version:
-                logger.info(f"✓ NumPy downgraded to {new_numpy_version}")
-                return True
-            else:
-                logger.error("NumPy downgrade verification failed")
-                return False
-        else:
+        if numpy_major is None or numpy_major < 2:
             logger.info(f"✓ NumPy {numpy_version} - compatible version")
             return True
+        
+        logger.warning(f"NumPy 2.x detected ({numpy_version}) - downgrading for compatibility")
+        logger.info("This may take a few minutes...")
+        
+        # For NumPy 2.x, we need to force reinstall with compatible versions,
+        # along with pandas and asammdf if they were built against it
+        reinstall_specs = {'numpy': "numpy>=1.20.0,<2.0.0"}
+        if self.check_package_availability('pandas')[0]:
+            reinstall_specs['pandas'] = "pandas>=1.5.0,<3.0.0"
+        if self.check_package_availability('asammdf')[0]:
+            reinstall_specs['asammdf'] = "asammdf>=7.0.0"
+        
+        logger.info(f"Reinstalling {', '.join(reinstall_specs)} for NumPy compatibility...")
+        force_reinstall = ["install", "--upgrade", "--force-reinstall"]
+        batch_ok = self.run_pip_command(force_reinstall + list(reinstall_specs.values()))
+        self._invalidate_dependency_cache()
+        
+        if not batch_ok:
+            # Retry one at a time so a single failing package does not block the rest
+            logger.warning("Batch reinstall failed - retrying packages individually")
+            for package, spec in reinstall_specs.items():
+                if self.run_pip_command(force_reinstall + [spec]):
+                    continue
+                if package == 'numpy':
+                    logger.error("Failed to downgrade NumPy")
+                    return False
+                logger.warning(f"Failed to reinstall {package} - may cause issues")
+        
+        # Verify the fix worked
+        numpy_available, new_numpy_version = self.check_package_availability('numpy')
+        if numpy_available and new_numpy_version:
+            logger.info(f"✓ NumPy downgraded to {new_numpy_version}")
+            return True
+        else:
+            logger.error("NumPy downgrade verification failed")
+            return False
     
     def check_all_dependencies(self) -> Dict[str, Dict]:
         """Check status of all dependencies"""
@@ -206,9 +258,15 @@ class DependencyManager:
             }
         }
         
+        # Versions are reused from the shared cache while the interpreter and site-packages are unchanged
+        all_packages = list(self.required_packages) + list(self.optional_packages)
+        versions = get_installed_versions(all_packages)
+        results = {package: (version is not None, version) for package, version in versions.items()}
+        self._availability_cache.update(results)
+        
         # Check required packages
         for package, info in self.required_packages.items():
-            available, version = self.check_package_availability(package)
+            available, version = results[package]
             status['required'][package] = {
                 'available': available,
                 'version': version,
@@ -221,7 +279,7 @@ class DependencyManager:
         
         # Check optional packages
         for package, info in self.optional_packages.items():
-            available, version = self.check_package_availability(package)
+            available, version = results[package]
             status['optional'][package] = {
                 'available': available,
                 'version': version,
@@ -239,21 +297,45 @@ class DependencyManager:
         
         success = True
         
+        # Collect everything missing so pip resolves and downloads in one run
+        missing_required = {
+            package: info for package, info in self.required_packages.items()
+            if not self.check_package_availability(package)[0]
+        }
+        missing_optional = {}
+        if install_optional:
+            missing_optional = {
+                package: info for package, info in self.optional_packages.items()
+                if not self.check_package_availability(package)[0]
+            }
+        
+        missing = {**missing_required, **missing_optional}
+        if not missing:
+            return success
+        
+        specs = [f"{package}{info['version']}" for package, info in missing.items()]
+        logger.info(f"Installing {', '.join(specs)}...")
+        
+        batch_ok = self.run_pip_command(["install"] + specs)
+        self._invalidate_dependency_cache()
+        
+        if batch_ok:
+            logger.info(f"✓ Successfully installed {', '.join(missing)}")
+            return success
+        
+        # Retry one at a time so a single failing package does not block the rest
+        logger.warning("Batch install failed - retrying packages individually")
+        
         # Install required packages
-        for package, info in self.required_packages.items():
-            available, _ = self.check_package_availability(package)
-            if not available:
-                if not self.install_package(package, info['version']):
-                    success = False
+        for package, info in missing_required.items():
+            if not self.install_package(package, info['version']):
+                success = False
         
         # Install optional packages if requested
-        if install_optional:
-            for package, info in self.optional_packages.items():
-                available, _ = self.check_package_availability(package)
-                if not available:
-                    if not self.install_package(package, info['version']):
-                        logger.warning(f"Could not install optional package {package}")
-                        # Don't mark as failure for optional packages
+        for package, info in missing_optional.items():
+            if not self.install_package(package, info['version']):
+                logger.warning(f"Could not install optional package {package}")
+                # Don't mark as failure for optional packages
         
         return success
     
@@ -282,7 +364,10 @@ class DependencyManager:
         self.report_dependency_status(status)
         
         # Install missing dependencies
-        if status['summary']['missing_required'] or (install_optional and status['summary']['missing_optional']):
+        did_install = bool(
+            status['summary']['missing_required'] or (install_optional and status['summary']['missing_optional'])
+        )
+        if did_install:
             logger.info("\n3. Installing missing dependencies...")
             if not self.install_missing_dependencies(install_optional):
                 logger.error("Failed to install some dependencies")
@@ -290,10 +375,13 @@ class DependencyManager:
         else:
             logger.info("\n3. All dependencies satisfied!")
         
-        # Final verification
-        logger.info("\n4. Final verification...")
-        final_status = self.check_all_dependencies()
-        self.report_dependency_status(final_status)
+        # Final verification (only needed if something was installed)
+        if did_install:
+            logger.info("\n4. Final verification...")
+            final_status = self.check_all_dependencies()
+            self.report_dependency_status(final_status)
+        else:
+            final_status = status
         
         # Summary
         logger.info("\n" + "=" * 60)
@@ -340,15 +428,28 @@ def main():
                        help='Skip optional dependencies')
     parser.add_argument('--check-only', action='store_true',
                        help='Only check dependencies, do not install')
+    parser.add_argument('--json', action='store_true',
+                       help='With --check-only, print the dependency status as JSON')
+    parser.add_argument('--quiet', action='store_true',
+                       help='Only log errors')
     
     args = parser.parse_args()
     
+    if args.quiet:
+        logging.getLogger().setLevel(logging.ERROR)
+    
     manager = DependencyManager()
     
     if args.check_only:
         logger.info("Dependency Check Mode")
         logger.info("=" * 40)
         status = manager.check_all_dependencies()
+        
+        if args.json:
+            json.dump(status, sys.stdout, indent=2, default=str)
+            sys.stdout.write("\n")
+            sys.exit(0 if status['summary']['all_required_met'] else 1)
+        
         manager.report_dependency_status(status)
         
         if status['summary']['all_required_met']:
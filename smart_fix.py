@@ -10,11 +10,122 @@ License: MIT
 import subprocess
 import sys
 import importlib
+import importlib.util
 import os
 import shutil
+import json
+import re
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+# NumPy 2.x breaks asammdf, so NumPy is pinned to 1.x
+NUMPY_PIN = "numpy>=1.20.0,<2.0.0"
+
+# Core packages installed by main(), as (pip spec, description)
+DEPENDENCIES = (
+    ("asammdf>=7.0.0", "MDF4 processing engine"),
+    ("customtkinter>=5.0.0", "Enhanced GUI components")
+)
+
+# Packages verified after installing, by import name
+PACKAGES_TO_CHECK = {
+    'numpy': 'NumPy (numerical computing)',
+    'asammdf': 'asammdf (MDF4 processing)',
+    'customtkinter': 'CustomTkinter (enhanced GUI)'
+}
+
+# pip output lines worth showing, and lines that describe a failure
+_RELEVANT_PIP_LINE = re.compile(r'Successfully installed|Requirement already satisfied|Collecting')
+_PIP_ERROR_LINE = re.compile(r'ERROR|(?i:error:)')
+
+# Contents of the generated run_mf4bridge.py launcher
+_LAUNCHER_TEMPLATE = '''#!/usr/bin/env python3
+import os
+import sys
+
+# Auto-generated launcher for MF4Bridge
+python_exe = {python_exe!r}
+args = [python_exe, "main.py"] + sys.argv[1:]
+
+if os.name == "nt":
+    # os.execv does not replace the process on Windows, so wait for the app instead
+    import subprocess
+    sys.exit(subprocess.call(args))
+
+# Replace this process with the app rather than keeping a parent around to wait
+os.execv(python_exe, args)
+'''
+
+# Last interpreter that passed the probe, with a stat fingerprint of its binary
+PYTHON_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "mf4bridge", "python_exe.json")
+
+# Imports each named package and prints {name: version or null} as JSON
+_CHECK_PACKAGES_SCRIPT = '''
+import importlib, json, sys
+versions = {}
+for name in sys.argv[1:]:
+    try:
+        versions[name] = str(getattr(importlib.import_module(name), "__version__", "unknown"))
+    except Exception:
+        versions[name] = None
+print(json.dumps(versions))
+'''
+
+def _probe_python(candidate):
+    """Test if a Python executable works"""
+    return subprocess.run(
+        [candidate, '-c', 'import sys; print(sys.version)'],
+        capture_output=True,
+        text=True,
+        timeout=10
+    )
+
+def _python_fingerprint(python_exe):
+    """Identify an interpreter binary by inode, mtime and size"""
+    st = os.stat(python_exe)
+    return [st.st_ino, st.st_mtime, st.st_size]
+
+def _load_cached_python():
+    """Return the cached interpreter path if its binary is unchanged, else None"""
+    try:
+        with open(PYTHON_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        python_exe = cached['path']
+        if _python_fingerprint(python_exe) == cached['fingerprint']:
+            return python_exe
+    except Exception:
+        pass
+    return None
+
+def _save_cached_python(python_exe):
+    """Remember a working interpreter for later runs"""
+    try:
+        # Resolve bare names like 'python3' so the fingerprint refers to a real file
+        python_path = shutil.which(python_exe) or python_exe
+        os.makedirs(os.path.dirname(PYTHON_CACHE_FILE), exist_ok=True)
+        temp_file = PYTHON_CACHE_FILE + ".tmp"
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump({'path': python_path, 'fingerprint': _python_fingerprint(python_path)}, f)
+        os.replace(temp_file, PYTHON_CACHE_FILE)
+    except Exception:
+        pass
 
 def find_working_python():
     """Find a working Python executable"""
+    # The interpreter running this script works by definition, unless it is a frozen app binary;
+    # if it is new enough and has pip there is nothing to search for
+    if (sys.executable and not getattr(sys, 'frozen', False) and
+            sys.version_info >= (3, 8) and importlib.util.find_spec('pip') is not None):
+        print(f"✓ Working Python found: {sys.executable}")
+        print(f"  Version: {sys.version}")
+        return sys.executable
+    
+    cached_python = _load_cached_python()
+    if cached_python:
+        print(f"✓ Using previously verified Python: {cached_python}")
+        return cached_python
+    
     # List of possible Python executables to try
     candidates = [
         sys.executable,  # Current (may not work)
@@ -33,74 +144,108 @@ def find_working_python():
     if which_python:
         candidates.append(which_python)
     
+    # Probe each distinct binary once, in preference order. Deduplicate on the resolved path but
+    # keep the path as found: a venv's bin/python is a symlink whose location selects the venv.
+    unique_candidates = {}
+    for candidate in candidates:
+        path = shutil.which(candidate) if candidate else None
+        if path:
+            unique_candidates.setdefault(os.path.realpath(path), path)
+    candidates = list(unique_candidates.values())
+    if not candidates:
+        return None
+    
     print("Testing Python executables...")
     
-    for candidate in candidates:
-        if not candidate:
-            continue
-            
-        try:
-            # Test if this Python executable works
-            result = subprocess.run(
-                [candidate, '-c', 'import sys; print(sys.version)'],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            
-            if result.returncode == 0:
-                version_line = result.stdout.strip()
-                print(f"✓ Working Python found: {candidate}")
-                print(f"  Version: {version_line}")
-                return candidate
-            else:
-                print(f"✗ {candidate}: Failed (exit code {result.returncode})")
+    # Probe every candidate at once so a slow or hung interpreter does not delay the others
+    executor = ThreadPoolExecutor(max_workers=len(candidates))
+    try:
+        futures = [executor.submit(_probe_python, candidate) for candidate in candidates]
+        
+        # Take results in preference order; later candidates keep running in the background
+        for candidate, future in zip(candidates, futures):
+            try:
+                result = future.result()
                 
-        except FileNotFoundError:
-            print(f"✗ {candidate}: Not found")
-        except Exception as e:
-            print(f"✗ {candidate}: Error - {e}")
+                if result.returncode == 0:
+                    version_line = result.stdout.strip()
+                    print(f"✓ Working Python found: {candidate}")
+                    print(f"  Version: {version_line}")
+                    _save_cached_python(candidate)
+                    return candidate
+                else:
+                    print(f"✗ {candidate}: Failed (exit code {result.returncode})")
+                    
+            except FileNotFoundError:
+                print(f"✗ {candidate}: Not found")
+            except Exception as e:
+                print(f"✗ {candidate}: Error - {e}")
+    finally:
+        executor.shutdown(wait=False)
     
     return None
 
+
 def run_pip_with_python(python_exe, command):
     """Run pip command with specific Python executable"""
     try:
-        full_command = [python_exe, "-m", "pip"] + command
+        # Skip pip's self-update check (a network round-trip) and never wait on a prompt
+        full_command = [python_exe, "-m", "pip", "--disable-pip-version-check", "--no-input"] + command
         print(f"Running: {' '.join(full_command)}")
         
-        result = subprocess.run(full_command, capture_output=True, text=True, timeout=300)
+        # Stream pip's combined output and show relevant lines as they arrive
+        process = subprocess.Popen(
+            full_command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1
+        )
         
-        if result.returncode == 0:
-            print("✓ Success")
-            # Only show relevant output
-            output_lines = result.stdout.strip().split('\n')
-            relevant_lines = [line for line in output_lines if 
-                            'Successfully installed' in line or 
-                            'Requirement already satisfied' in line or
-                            'Collecting' in line]
-            
-            if relevant_lines:
-                for line in relevant_lines[-3:]:  # Show last 3 relevant lines
+        # Reading the pipe blocks, so enforce the timeout by killing pip
+        timed_out = threading.Event()
+        
+        def kill_on_timeout():
+            timed_out.set()
+            process.kill()
+        
+        timer = threading.Timer(300, kill_on_timeout)
+        timer.daemon = True
+        timer.start()
+        
+        error_lines = deque(maxlen=2)  # Only the last 2 error lines are shown
+        last_line = ""
+        try:
+            for line in process.stdout:
+                line = line.rstrip()
+                if not line:
+                    continue
+                last_line = line
+                if _RELEVANT_PIP_LINE.search(line):
                     print(f"  {line}")
+                elif _PIP_ERROR_LINE.search(line):
+                    error_lines.append(line)
+            returncode = process.wait()
+        finally:
+            timer.cancel()
+            process.stdout.close()
+        
+        if timed_out.is_set():
+            print("✗ Timeout (command took too long)")
+            return False
+        
+        if returncode == 0:
+            print("✓ Success")
             return True
         else:
             print("✗ Failed")
-            if result.stderr.strip():
-                # Show only the most relevant error lines
-                error_lines = result.stderr.strip().split('\n')
-                important_errors = [line for line in error_lines if 
-                                  'ERROR' in line or 'error:' in line.lower()]
-                
-                if important_errors:
-                    for line in important_errors[-2:]:  # Show last 2 error lines
-                        print(f"  Error: {line}")
-                else:
-                    print(f"  Error: {error_lines[-1]}")  # Show last line
+            # Show only the most relevant error lines
+            if error_lines:
+                for line in error_lines:
+                    print(f"  Error: {line}")
+            elif last_line:
+                print(f"  Error: {last_line}")  # Show last line
             return False
-    except subprocess.TimeoutExpired:
-        print("✗ Timeout (command took too long)")
-        return False
     except Exception as e:
         print(f"✗ Exception: {e}")
         return False
@@ -124,6 +269,25 @@ def check_package_with_python(python_exe, package_name):
     except Exception:
         return False, None
 
+def check_packages_with_python(python_exe, package_names):
+    """Check several packages with one interpreter start, returning {name: (available, version)}"""
+    try:
+        result = subprocess.run(
+            [python_exe, '-c', _CHECK_PACKAGES_SCRIPT] + list(package_names),
+            capture_output=True,
+            text=True,
+            timeout=30
+        )
+        
+        if result.returncode == 0:
+            versions = json.loads(result.stdout.strip().splitlines()[-1])
+            return {name: (versions.get(name) is not None, versions.get(name)) for name in package_names}
+            
+    except Exception:
+        pass
+    
+    return {name: (False, None) for name in package_names}
+
 def main():
     print("=" * 70)
     print("MF4Bridge Smart Environment Fix")
@@ -144,6 +308,8 @@ def main():
     print(f"\n📦 Checking current packages...")
     numpy_available, numpy_version = check_package_with_python(python_exe, 'numpy')
     
+    dependencies = list(DEPENDENCIES)
+    
     if numpy_available:
         print(f"Current NumPy: {numpy_version}")
         
@@ -154,15 +320,9 @@ def main():
             
             # Force reinstall compatible NumPy
             print(f"\n🔧 Installing compatible NumPy...")
-            if run_pip_with_python(python_exe, ["install", "--upgrade", "--force-reinstall", "numpy>=1.20.0,<2.0.0"]):
+            if run_pip_with_python(python_exe, ["install", "--upgrade", "--force-reinstall", NUMPY_PIN]):
+                # The final verification below confirms the new version
                 print("✅ NumPy downgraded successfully")
-                
-                # Verify the downgrade
-                numpy_available, new_version = check_package_with_python(python_exe, 'numpy')
-                if numpy_available:
-                    print(f"✅ Verified: NumPy {new_version}")
-                else:
-                    print("⚠️  Could not verify NumPy installation")
             else:
                 print("❌ Failed to downgrade NumPy")
                 print("\nTrying alternative approach...")
@@ -170,7 +330,7 @@ def main():
                 print("Uninstalling NumPy 2.x...")
                 run_pip_with_python(python_exe, ["uninstall", "-y", "numpy"])
                 print("Installing NumPy 1.x...")
-                if run_pip_with_python(python_exe, ["install", "numpy>=1.20.0,<2.0.0"]):
+                if run_pip_with_python(python_exe, ["install", NUMPY_PIN]):
                     print("✅ NumPy installed via alternative method")
                 else:
                     print("❌ Failed to install NumPy")
@@ -178,52 +338,47 @@ def main():
         else:
             print("✅ NumPy version is compatible")
     else:
-        print("NumPy not found - installing...")
-        if run_pip_with_python(python_exe, ["install", "numpy>=1.20.0,<2.0.0"]):
-            print("✅ NumPy installed")
-        else:
-            print("❌ Failed to install NumPy")
-            return False
+        print("NumPy not found - installing with core dependencies")
+        dependencies.insert(0, (NUMPY_PIN, "Numerical computing"))
     
-    # Install core dependencies
+    # Install core dependencies in one pip run so the resolver starts once
     print(f"\n📦 Installing core dependencies...")
     
-    dependencies = [
-        ("asammdf>=7.0.0", "MDF4 processing engine"),
-        ("customtkinter>=5.0.0", "Enhanced GUI components")
-    ]
-    
     success_count = 0
-    for dep_spec, description in dependencies:
-        dep_name = dep_spec.split('>=')[0].split('==')[0]
-        print(f"\n🔧 Installing {dep_name} ({description})...")
-        
-        if run_pip_with_python(python_exe, ["install", dep_spec]):
-            print(f"✅ {dep_name} installed successfully")
-            success_count += 1
-        else:
-            print(f"⚠️  Failed to install {dep_name}")
-            # For core dependencies, try without version constraints
-            if dep_name == "asammdf":
-                print(f"Trying to install {dep_name} without version constraints...")
-                if run_pip_with_python(python_exe, ["install", dep_name]):
-                    print(f"✅ {dep_name} installed (fallback)")
-                    success_count += 1
+    if run_pip_with_python(python_exe, ["install"] + [dep_spec for dep_spec, _ in dependencies]):
+        print("✅ Core dependencies installed successfully")
+        success_count = len(dependencies)
+    else:
+        # Retry one at a time so failures are attributed to the right package
+        print("⚠️  Batch install failed - retrying packages individually")
+        for dep_spec, description in dependencies:
+            dep_name = dep_spec.split('>=')[0].split('==')[0]
+            print(f"\n🔧 Installing {dep_name} ({description})...")
+            
+            if run_pip_with_python(python_exe, ["install", dep_spec]):
+                print(f"✅ {dep_name} installed successfully")
+                success_count += 1
+            else:
+                print(f"⚠️  Failed to install {dep_name}")
+                if dep_name == "numpy":
+                    print("❌ Failed to install NumPy")
+                    return False
+                # For core dependencies, try without version constraints
+                if dep_name == "asammdf":
+                    print(f"Trying to install {dep_name} without version constraints...")
+                    if run_pip_with_python(python_exe, ["install", dep_name]):
+                        print(f"✅ {dep_name} installed (fallback)")
+                        success_count += 1
     
     # Verify installation
     print(f"\n🔍 Verifying installation...")
     
-    packages_to_check = {
-        'numpy': 'NumPy (numerical computing)',
-        'asammdf': 'asammdf (MDF4 processing)',
-        'customtkinter': 'CustomTkinter (enhanced GUI)'
-    }
-    
     working_packages = 0
     critical_packages = 0
     
-    for package, description in packages_to_check.items():
-        available, version = check_package_with_python(python_exe, package)
+    package_status = check_packages_with_python(python_exe, list(PACKAGES_TO_CHECK))
+    for package, description in PACKAGES_TO_CHECK.items():
+        available, version = package_status[package]
         if available:
             print(f"✅ {package}: {version} - {description}")
             working_packages += 1
@@ -236,7 +391,7 @@ def main():
     print("SUMMARY")
     print("=" * 70)
     print(f"Python executable: {python_exe}")
-    print(f"Packages working: {working_packages}/{len(packages_to_check)}")
+    print(f"Packages working: {working_packages}/{len(PACKAGES_TO_CHECK)}")
     print(f"Critical packages: {critical_packages}/2")
     
     if critical_packages >= 1:  # At least numpy working
@@ -253,16 +408,14 @@ def main():
         
         # Create a simple launcher script
         try:
-            with open('run_mf4bridge.py', 'w') as f:
-                f.write(f'#!/usr/bin/env python3\n')
-                f.write(f'import subprocess\n')
-                f.write(f'import sys\n\n')
-                f.write(f'# Auto-generated launcher for MF4Bridge\n')
-                f.write(f'python_exe = "{python_exe}"\n')
-                f.write(f'subprocess.run([python_exe, "main.py"] + sys.argv[1:])\n')
+            # Write the whole launcher to a temp file and swap it in, so it is never half-written
+            temp_launcher = 'run_mf4bridge.py.tmp'
+            with open(temp_launcher, 'w') as f:
+                f.write(_LAUNCHER_TEMPLATE.format(python_exe=python_exe))
             
-            import stat
-            os.chmod('run_mf4bridge.py', stat.S_IRWXU | stat.S_IRGRP | stat.S_IROTH)
+            # Add execute permission without clobbering the mode the umask gave the file
+            os.chmod(temp_launcher, os.stat(temp_launcher).st_mode | 0o111)
+            os.replace(temp_launcher, 'run_mf4bridge.py')
             print(f"\n💡 Created launcher: run_mf4bridge.py")
             
         except Exception as e:
@@ -272,7 +425,7 @@ def main():
     else:
         print(f"\n❌ Critical dependencies missing")
         print(f"Please check the error messages above and try manual installation:")
-        print(f"{python_exe} -m pip install numpy>=1.20.0,<2.0.0")
+        print(f"{python_exe} -m pip install {NUMPY_PIN}")
         print(f"{python_exe} -m pip install asammdf>=7.0.0")
         return False
 
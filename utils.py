@@ -15,6 +15,11 @@ import platform
 import threading
 import time
 import hashlib
+import json
+import importlib.metadata
+import importlib.util
+import site
+import sysconfig
 from pathlib import Path
 from typing import List, Union, Dict, Any, Optional, Tuple, Callable
 import logging
@@ -22,6 +27,9 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 
 logger = logging.getLogger(__name__)
 
+# Installed package versions from the last dependency check, shared by main.py and setup_environment.py
+DEPENDENCY_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "mf4bridge", "deps.json")
+
 class ValidationError(Exception):
     """Custom exception for validation errors"""
     pass
@@ -581,8 +589,9 @@ def check_dependencies() -> Dict[str, Any]:
             # Check optional dependencies with version analysis
             for dep_name, dep_info in optional_deps.items():
                 try:
-                    module = __import__(dep_name)
-                    version = getattr(module, '__version__', 'unknown')
+                    version = get_installed_version(dep_name)
+                    if version is None:
+                        raise ImportError(f"No module named '{dep_name}'")
                     
                     # Analyze version compatibility
                     status = 'ok'
@@ -651,6 +660,82 @@ def check_dependencies() -> Dict[str, Any]:
     
     return dependencies
 
+def get_installed_version(package_name: str) -> Optional[str]:
+    """
+    Read a package version from its installed metadata without importing it
+    
+    Args:
+        package_name: Importable package name
+        
+    Returns:
+        Version string, 'unknown' if the package has no metadata, or None if it is not installed
+    """
+    try:
+        if importlib.util.find_spec(package_name) is None:
+            return None
+    except (ImportError, ValueError):
+        return None
+    
+    try:
+        return importlib.metadata.version(package_name)
+    except importlib.metadata.PackageNotFoundError:
+        # No dist-info, e.g. a source checkout on sys.path
+        return 'unknown'
+
+def get_dependency_cache_key() -> str:
+    """
+    Identify this interpreter and its installed packages for the dependency cache
+    
+    Returns:
+        Key that changes whenever pip installs, upgrades or removes a package
+    """
+    # pip adds or renames dist-info folders on install/upgrade, which bumps the site-packages mtime;
+    # the user site-packages is included so `pip install --user` invalidates the cache too
+    paths = dict.fromkeys([
+        sys.executable,
+        sysconfig.get_paths()["purelib"],
+        sysconfig.get_paths()["platlib"],
+        site.getusersitepackages()
+    ])
+    
+    key_parts = [sys.executable]
+    for path in paths:
+        try:
+            key_parts.append(str(os.path.getmtime(path)))
+        except OSError:
+            key_parts.append("0")
+    return "|".join(key_parts)
+
+def get_installed_versions(package_names: List[str]) -> Dict[str, Optional[str]]:
+    """
+    Look up installed package versions, reusing cached results while the environment is unchanged
+    
+    Args:
+        package_names: Importable package names
+        
+    Returns:
+        Dictionary mapping each name to its version, 'unknown', or None if it is not installed
+    """
+    cache_key = get_dependency_cache_key()
+    cached = load_settings(DEPENDENCY_CACHE_FILE)
+    versions = cached.get('versions', {}) if cached.get('key') == cache_key else {}
+    
+    missing = [name for name in package_names if name not in versions]
+    if missing:
+        # The lookups are dominated by filesystem reads, so probe them concurrently
+        with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+            versions.update(zip(missing, executor.map(get_installed_version, missing)))
+        save_settings({'key': cache_key, 'versions': versions}, DEPENDENCY_CACHE_FILE)
+    
+    return {name: versions[name] for name in package_names}
+
+def clear_dependency_cache() -> None:
+    """Drop cached package versions after pip has changed installed packages"""
+    try:
+        os.remove(DEPENDENCY_CACHE_FILE)
+    except OSError:
+        pass
+
 def _compare_versions(version1: str, version2: str) -> int:
     """
     Compare two version strings
@@ -864,6 +949,61 @@ def get_application_path() -> str:
         logger.error(f"Error determining application path: {e}")
         return os.getcwd()
 
+def get_settings_path() -> str:
+    """
+    Get the path of the per-user settings file
+    
+    Returns:
+        Path to the JSON settings file
+    """
+    return os.path.join(os.path.expanduser("~"), ".mf4bridge", "settings.json")
+
+def load_settings(settings_path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Load persisted user settings
+    
+    Args:
+        settings_path: Optional settings file path (default: get_settings_path())
+        
+    Returns:
+        Settings dictionary, empty if the file is missing or unreadable
+    """
+    settings_path = settings_path or get_settings_path()
+    
+    try:
+        with open(settings_path, 'r', encoding='utf-8') as f:
+            settings = json.load(f)
+        return settings if isinstance(settings, dict) else {}
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.debug(f"Could not load settings from {settings_path}: {e}")
+        return {}
+
+def save_settings(settings: Dict[str, Any], settings_path: Optional[str] = None) -> bool:
+    """
+    Persist user settings atomically
+    
+    Args:
+        settings: Settings dictionary (must be JSON serializable)
+        settings_path: Optional settings file path (default: get_settings_path())
+        
+    Returns:
+        True if the settings were written, False otherwise
+    """
+    settings_path = settings_path or get_settings_path()
+    
+    try:
+        os.makedirs(os.path.dirname(settings_path), exist_ok=True)
+        temp_path = f"{settings_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(settings, f, indent=2)
+        os.replace(temp_path, settings_path)
+        return True
+    except Exception as e:
+        logger.debug(f"Could not save settings to {settings_path}: {e}")
+        return False
+
 def batch_file_operations(file_paths: List[str], operation_func: Callable, max_workers: int = 4) -> List[Any]:
     """
     Perform file operations in parallel with thread pool